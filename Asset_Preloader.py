@@ -0,0 +1,147 @@
+import os
+import queue
+import threading
+import time
+import types
+from functools import partial
+
+from PIL import Image
+
+import Gif_Cache
+import Sprite_Cache
+import Music_Manager
+from Dimensiones import ANCHO_VENTANA, ALTO_VENTANA, TILE
+
+'''Precarga de recursos al iniciar
+
+Un hilo recorre ASSETS/ y hace la parte lenta de cada recurso: leer el
+archivo y decodificarlo con PIL. Las superficies de pygame se crean en el
+hilo principal (procesar(), llamado en cada frame de la pantalla de
+carga) y quedan en las mismas cachés que usan las pantallas y los modos,
+así ninguna pantalla lee el disco al abrirse.
+'''
+
+CARPETA_ASSETS = "ASSETS"
+
+# Los fondos se escalan al tamaño de la ventana y los sprites al de una casilla
+TAMAÑO_FONDO = (ANCHO_VENTANA, ALTO_VENTANA)
+
+# Remuestreo con el que se escala cada fondo (los que no están usan el de PIL por defecto)
+REMUESTREO_FONDOS = {"BG_1.gif": Image.LANCZOS}
+
+# Tiempo por frame que el hilo principal dedica a crear superficies
+MS_POR_FRAME = 8
+
+# Marca de generador agotado en procesar()
+FIN = object()
+
+
+def leer_archivo(ruta):
+    """Bytes del archivo, o None si no se pudo leer"""
+    try:
+        with open(ruta, "rb") as f:
+            return f.read()
+    except OSError as e:
+        print(f"Error al precargar {ruta}: {e}")
+        return None
+
+
+def crear_efecto(ruta, nombre_efecto, datos):
+    Music_Manager.agregar_archivo(ruta, datos)
+    Music_Manager.cargar_efecto(nombre_efecto)
+
+
+class AssetPreloader:
+    def __init__(self, carpeta=CARPETA_ASSETS):
+        # (leer, crear): leer() corre en el hilo de carga y crear(datos) en el principal.
+        # crear() puede devolver un generador para hacer su trabajo de a partes
+        # (un GIF crea un frame por paso) y no pasarse del tiempo de un frame
+        self.tareas = self.buscar_tareas(carpeta)
+        self.total = len(self.tareas)
+        self.terminadas = 0
+        # Generador de la tarea que quedó a medias en el frame anterior
+        self.en_curso = None
+
+        self.resultados = queue.Queue()
+        self.hilo = threading.Thread(target=self.trabajar, daemon=True)
+
+    def buscar_tareas(self, carpeta):
+        tareas = []
+        for raiz, carpetas, archivos in os.walk(carpeta):
+            carpetas.sort()
+            for archivo in sorted(archivos):
+                # Las mismas rutas que usa el juego (con "/"), que son las claves de las cachés
+                ruta = os.path.join(raiz, archivo).replace(os.sep, "/")
+                nombre, extension = os.path.splitext(archivo)
+                extension = extension.lower()
+
+                if extension == ".gif":
+                    remuestreo = REMUESTREO_FONDOS.get(archivo)
+                    tareas.append((
+                        partial(Gif_Cache.leer_frames, ruta, TAMAÑO_FONDO, remuestreo),
+                        partial(Gif_Cache.crear_frames, ruta, TAMAÑO_FONDO, remuestreo)
+                    ))
+                elif extension == ".png":
+                    tareas.append((
+                        partial(Sprite_Cache.leer_imagen, ruta),
+                        partial(Sprite_Cache.agregar_sprite, ruta, (TILE, TILE))
+                    ))
+                elif extension == ".mp3":
+                    if ruta == Music_Manager.ruta_efecto(nombre):
+                        crear = partial(crear_efecto, ruta, nombre)
+                    else:
+                        crear = partial(Music_Manager.agregar_archivo, ruta)
+                    tareas.append((partial(leer_archivo, ruta), crear))
+        return tareas
+
+    def iniciar(self):
+        self.hilo.start()
+
+    def trabajar(self):
+        """Hilo de carga: solo archivos y PIL, nada de pygame"""
+        for leer, crear in self.tareas:
+            try:
+                datos = leer()
+            except Exception as e:
+                print(f"Error al precargar: {e}")
+                datos = None
+            self.resultados.put((crear, datos))
+
+    def procesar(self, ms=MS_POR_FRAME):
+        """Crea las superficies de lo que el hilo ya leyó, sin pasar de 'ms' en este frame"""
+        limite = time.perf_counter() + ms / 1000
+        while self.terminadas < self.total and time.perf_counter() < limite:
+            if self.en_curso is None:
+                try:
+                    crear, datos = self.resultados.get_nowait()
+                except queue.Empty:
+                    break
+                try:
+                    resultado = crear(datos)
+                except Exception as e:
+                    # Igual que en el hilo: se avisa y la tarea cuenta como terminada
+                    print(f"Error al precargar: {e}")
+                    resultado = None
+                if isinstance(resultado, types.GeneratorType):
+                    self.en_curso = resultado
+                else:
+                    self.terminadas += 1
+                continue
+
+            # Un paso de la tarea a medias; al agotarse (o fallar), la tarea terminó
+            try:
+                paso = next(self.en_curso, FIN)
+            except Exception as e:
+                print(f"Error al precargar: {e}")
+                paso = FIN
+            if paso is FIN:
+                self.en_curso = None
+                self.terminadas += 1
+
+    def progreso(self):
+        if self.total == 0:
+            return 1.0
+        return self.terminadas / self.total
+
+    def terminado(self):
+        return self.terminadas >= self.total
@@ -0,0 +1,69 @@
+import math
+
+import pygame
+
+'''Cámara del mapa
+
+La cámara decide qué parte del mapa se ve en la "vista" (el rectángulo de
+la ventana reservado para el mapa). Si el mapa entra completo se dibuja
+centrado en la vista, como siempre; si es más grande, la cámara sigue al
+jugador sin mostrar nada fuera de los bordes del mapa. Todo lo que se
+dibuja pregunta antes si está en pantalla, así el costo de cada frame
+depende del tamaño de la vista y no del tamaño del mapa.
+'''
+
+
+class Camera:
+    def __init__(self, vista, tile_size):
+        self.vista = pygame.Rect(vista)
+        self.tile_size = tile_size
+
+        # Tamaño del mapa en píxeles
+        self.ancho_mapa = 0
+        self.alto_mapa = 0
+        self.filas = 0
+        self.columnas = 0
+
+        # Píxel del mapa que queda en la esquina superior izquierda de la vista
+        self.x = 0
+        self.y = 0
+
+    def ajustar_mapa(self, filas, columnas):
+        self.filas = filas
+        self.columnas = columnas
+        self.ancho_mapa = columnas * self.tile_size
+        self.alto_mapa = filas * self.tile_size
+        self.seguir(filas / 2, columnas / 2)
+
+    def seguir(self, fila, col):
+        """Centra la cámara en la casilla (acepta posiciones interpoladas)"""
+        centro_x = col * self.tile_size + self.tile_size / 2
+        centro_y = fila * self.tile_size + self.tile_size / 2
+        self.x = self.limitar(centro_x - self.vista.width / 2, self.ancho_mapa, self.vista.width)
+        self.y = self.limitar(centro_y - self.vista.height / 2, self.alto_mapa, self.vista.height)
+
+    def limitar(self, inicio, tamaño_mapa, tamaño_vista):
+        # Un mapa más chico que la vista queda centrado
+        if tamaño_mapa <= tamaño_vista:
+            return -((tamaño_vista - tamaño_mapa) // 2)
+        return round(max(0, min(inicio, tamaño_mapa - tamaño_vista)))
+
+    def desplazamiento(self):
+        """Dónde cae en la ventana la esquina del mapa (el margen que usan los dibujar())"""
+        return self.vista.x - self.x, self.vista.y - self.y
+
+    def rango_visible(self):
+        """(fila_inicio, fila_fin, col_inicio, col_fin) de las casillas en pantalla (fin excluido)"""
+        tile = self.tile_size
+        fila_inicio = max(0, self.y // tile)
+        col_inicio = max(0, self.x // tile)
+        fila_fin = min(self.filas, math.ceil((self.y + self.vista.height) / tile))
+        col_fin = min(self.columnas, math.ceil((self.x + self.vista.width) / tile))
+        return fila_inicio, fila_fin, col_inicio, col_fin
+
+    def es_visible(self, fila, col):
+        """Si alguna parte de la casilla (o de una entidad a mitad de paso) está en pantalla"""
+        tile = self.tile_size
+        x = col * tile - self.x
+        y = fila * tile - self.y
+        return -tile < x < self.vista.width and -tile < y < self.vista.height
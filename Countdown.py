@@ -1,5 +1,6 @@
 import pygame
 import time
+import Text_Cache
 
 class Countdown:
     """Cuenta regresiva 3-2-1-GO! antes de iniciar el juego"""
@@ -19,8 +20,8 @@ class Countdown:
         
     def dibujar_numero(self, texto):
         # Crear texto con sombra para efecto 3D
-        texto_sombra = self.fuente_grande.render(texto, True, (100, 80, 0))
-        texto_principal = self.fuente_grande.render(texto, True, self.color_dorado)
+        texto_sombra = Text_Cache.renderizar(self.fuente_grande, texto, True, (100, 80, 0))
+        texto_principal = Text_Cache.renderizar(self.fuente_grande, texto, True, self.color_dorado)
         
         # Centrar texto
         rect_texto = texto_principal.get_rect(center=(self.ancho_ventana // 2, self.alto_ventana // 2))
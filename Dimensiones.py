@@ -0,0 +1,12 @@
+'''Tamaños compartidos
+
+La ventana y las casillas del mapa: los usan los modos de juego y la
+precarga de recursos (que escala los fondos y los sprites a estos tamaños
+antes de que se abra ningún modo).
+'''
+
+ANCHO_VENTANA = 800
+ALTO_VENTANA = 600
+
+# Lado de una casilla del mapa en píxeles
+TILE = 25
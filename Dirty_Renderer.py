@@ -0,0 +1,96 @@
+import pygame
+
+'''Dibujado por rectángulos sucios
+
+Con el fondo quieto, casi toda la pantalla es igual de un frame al
+siguiente: solo cambian las casillas donde están (o estaban) el jugador,
+los enemigos y las trampas, y los widgets del HUD cuyo valor cambió.
+El renderer guarda la escena fija (fondo y mapa) en una superficie
+aparte, la usa para borrar lo que se dibujó en el frame anterior y
+manda a la pantalla solo esos rectángulos con pygame.display.update().
+'''
+
+
+class DirtyRenderer:
+    def __init__(self, ventana):
+        self.ventana = ventana
+        # Escena sin entidades ni HUD, y con qué clave (posición de la cámara) se dibujó
+        self.base = None
+        self.clave_base = None
+        # Rectángulos de las entidades dibujadas en el frame anterior
+        self.rects_entidades = []
+        # widget -> estado() con el que se dibujó por última vez
+        self.estados_hud = {}
+        # Zonas de la escena fija que cambiaron (una casilla del mapa) y hay que redibujar
+        self.rects_base = []
+        # Rectángulos a mandar a la pantalla en este frame (None = toda)
+        self.sucios = []
+
+    def invalidar(self):
+        """La próxima vez se redibuja toda la pantalla"""
+        self.base = None
+
+    def base_cambiada(self, rect):
+        """Marca una zona de la escena fija para redibujar solo esa parte en el próximo comenzar()"""
+        if self.base is not None:
+            self.rects_base.append(rect)
+
+    def comenzar(self, clave, dibujar_base):
+        """Prepara el frame: redibuja la escena fija si cambió 'clave' y borra las entidades anteriores
+
+        dibujar_base(superficie) dibuja el fondo y el mapa respetando el
+        clip de la superficie (así se puede redibujar una sola zona).
+        """
+        if self.base is None or clave != self.clave_base:
+            if self.base is None or self.base.get_size() != self.ventana.get_size():
+                self.base = pygame.Surface(self.ventana.get_size()).convert()
+            dibujar_base(self.base)
+            self.clave_base = clave
+            self.ventana.blit(self.base, (0, 0))
+            self.rects_entidades = []
+            self.rects_base = []
+            self.estados_hud = {}
+            self.sucios = None
+            return
+
+        # Redibujar en la escena fija solo las zonas que cambiaron
+        for rect in self.rects_base:
+            self.base.set_clip(rect)
+            dibujar_base(self.base)
+            self.base.set_clip(None)
+
+        # Borrar lo que se dibujó en el frame anterior y mostrar las zonas redibujadas
+        self.sucios = self.rects_base + self.rects_entidades
+        for rect in self.sucios:
+            self.restaurar(rect)
+        self.rects_base = []
+        self.rects_entidades = []
+
+    def restaurar(self, rect):
+        self.ventana.blit(self.base, rect, rect)
+
+    def entidad(self, rect):
+        """Registra el rectángulo de una entidad dibujada en este frame"""
+        self.rects_entidades.append(rect)
+        if self.sucios is not None:
+            self.sucios.append(rect)
+
+    def widget(self, widget):
+        """Dibuja el widget del HUD solo si cambió lo que muestra"""
+        estado = widget.estado()
+        if widget in self.estados_hud and self.estados_hud[widget] == estado:
+            return
+
+        rect = pygame.Rect(widget.x, widget.y, widget.width, widget.height)
+        self.restaurar(rect)
+        widget.draw(self.ventana, estado)
+        self.estados_hud[widget] = estado
+        if self.sucios is not None:
+            self.sucios.append(rect)
+
+    def terminar(self):
+        """Manda a la pantalla solo lo que cambió (o todo si se redibujó la escena)"""
+        if self.sucios is None:
+            pygame.display.flip()
+        elif self.sucios:
+            pygame.display.update(self.sucios)
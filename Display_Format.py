@@ -0,0 +1,48 @@
+import pygame
+
+'''Formato de pantalla para todas las imágenes
+
+Cada imagen se pasa una sola vez al formato de la ventana: convert() si
+es opaca y convert_alpha() solo si tiene transparencia. Así los blit de
+cada frame son copias directas, sin convertir píxel por píxel. Las
+cachés de imágenes se registran en al_crear_ventana para volver a
+convertir lo que se cargó antes de que existiera la ventana.
+'''
+
+# Funciones que se llaman después de crear (o cambiar) la ventana
+al_crear_ventana = []
+
+
+def hay_ventana():
+    return pygame.display.get_surface() is not None
+
+
+def tiene_transparencia(superficie):
+    """Si algún píxel no es completamente opaco"""
+    if superficie.get_colorkey() is not None:
+        return True
+    if not superficie.get_flags() & pygame.SRCALPHA:
+        return False
+    alfas = pygame.image.tobytes(superficie, "RGBA")[3::4]
+    return alfas.count(255) != len(alfas)
+
+
+def convertir(superficie, alpha=None):
+    """La superficie en el formato de la ventana (sin cambios si todavía no hay ventana)
+
+    Con alpha=None se mira si la imagen tiene transparencia; True o False
+    lo fuerzan cuando ya se sabe (por ejemplo, superficies creadas con SRCALPHA).
+    """
+    if superficie is None or not hay_ventana():
+        return superficie
+    if alpha is None:
+        alpha = tiene_transparencia(superficie)
+    return superficie.convert_alpha() if alpha else superficie.convert()
+
+
+def crear_ventana(tamaño, flags=0):
+    """pygame.display.set_mode() que además convierte las imágenes ya cargadas"""
+    ventana = pygame.display.set_mode(tamaño, flags)
+    for funcion in al_crear_ventana:
+        funcion()
+    return ventana
@@ -1,7 +1,8 @@
 import pygame
-import json
-import os
 import Music_Manager
+import Settings_Manager
+import Text_Cache
+from Leaderboard import leaderboard
 
 ANCHO_VENTANA = 800
 ALTO_VENTANA = 600
@@ -18,55 +19,39 @@ class EndingScreen:
         self.font_med = pygame.font.Font(None, 40)
         self.font_small = pygame.font.Font(None, 30)
 
-        # ARCHIVO CORRECTO SEGÚN EL MODO
-        self.archivo = f"scores_{modo}.json"
-
         self.scores = self.cargar_scores()
         self.actualizar_scores()
         try:
-            pygame.mixer.music.load("ASSETS/OST/Ending.mp3")
+            Music_Manager.cargar_pista("ASSETS/OST/Ending.mp3")
             
-            # Cargar configuración de volumen
-            if os.path.exists("settings.json"):
-                with open("settings.json", "r") as f:
-                    settings = json.load(f)
-                    if settings.get("musica_activada", True):
-                        volumen = settings.get("volumen_musica", 5) / 10
-                        pygame.mixer.music.set_volume(volumen)
-                        pygame.mixer.music.play(0)
+            # Configuración de volumen en memoria
+            settings = Settings_Manager.obtener()
+            if settings.get("musica_activada", True):
+                volumen = settings.get("volumen_musica", 5) / 10
+                pygame.mixer.music.set_volume(volumen)
+                pygame.mixer.music.play(0)
         except Exception as e:
             print(f"Error al cargar música de ending: {e}")
 
     def cargar_scores(self):
-        if not os.path.exists(self.archivo):
+        try:
+            return leaderboard.obtener_top(self.modo, 5)
+        except Exception as e:
+            print(f"Error al cargar puntajes: {e}")
             return []
 
-        with open(self.archivo, "r") as f:
-            try:
-                return json.load(f)
-            except:
-                return []
-
     def actualizar_scores(self):
-        # Si el archivo no existe, inicializa una lista vacía
-        if os.path.exists(self.archivo):
-            with open(self.archivo, "r") as f:
-                data = json.load(f)
-        else:
-            data = []
-
-        # Agregar el puntaje actual
-        data.append({"name": self.player_name, "score": self.player_score})
+        # Agregar el puntaje actual al top ya leído (sin esperar a la base)
+        data = self.scores + [{"name": self.player_name, "score": self.player_score}]
 
         # Ordenar y conservar solo top 5
-        data = sorted(data, key=lambda x: x["score"], reverse=True)[:5]
-
-        # Guardar
-        with open(self.archivo, "w") as f:
-            json.dump(data, f, indent=4)
+        self.scores = sorted(data, key=lambda x: x["score"], reverse=True)[:5]
 
-        # Actualizar la lista interna
-        self.scores = data
+        # Guardar en el historial en segundo plano
+        try:
+            leaderboard.registrar(self.modo, self.player_name, self.player_score)
+        except Exception as e:
+            print(f"Error al guardar puntaje: {e}")
 
     def run(self):
         corriendo = True
@@ -92,14 +77,14 @@ class EndingScreen:
         self.ventana.fill((0, 0, 0))
 
         # Texto principal
-        titulo = self.font_big.render("¡FIN DEL JUEGO!", True, (255, 255, 255))
+        titulo = Text_Cache.renderizar(self.font_big, "¡FIN DEL JUEGO!", True, (255, 255, 255))
         self.ventana.blit(titulo, (ANCHO_VENTANA//2 - titulo.get_width()//2, 40))
 
         # Puntaje del jugador
-        score_text = self.font_med.render(f"Puntaje: {self.player_score}", True, (255, 255, 0))
+        score_text = Text_Cache.renderizar(self.font_med, f"Puntaje: {self.player_score}", True, (255, 255, 0))
         self.ventana.blit(score_text, (ANCHO_VENTANA//2 - score_text.get_width()//2, 120))
 
-        top_title = self.font_med.render(f"TOP 5 - MODO {self.modo.upper()}", True, (0, 255, 255))
+        top_title = Text_Cache.renderizar(self.font_med, f"TOP 5 - MODO {self.modo.upper()}", True, (0, 255, 255))
         self.ventana.blit(top_title, (ANCHO_VENTANA//2 - top_title.get_width()//2, 200))
 
         # Mostrar Top 5
@@ -107,10 +92,10 @@ class EndingScreen:
         for idx, datos in enumerate(self.scores):
             nombre = datos["name"]
             puntaje = datos["score"]
-            linea = self.font_small.render(f"{idx+1}. {nombre} - {puntaje}",True,(255, 255, 255))
+            linea = Text_Cache.renderizar(self.font_small, f"{idx+1}. {nombre} - {puntaje}",True,(255, 255, 255))
             self.ventana.blit(linea, (ANCHO_VENTANA//2 - linea.get_width()//2, y))
             y += 40
 
         # Instrucción
-        texto = self.font_small.render("Presiona ENTER para volver al menú principal...", True, (200, 200, 200))
+        texto = Text_Cache.renderizar(self.font_small, "Presiona ENTER para volver al menú principal...", True, (200, 200, 200))
         self.ventana.blit(texto, (ANCHO_VENTANA//2 - texto.get_width()//2, 520))
\ No newline at end of file
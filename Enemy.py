@@ -1,6 +1,6 @@
-import pygame
-import random
-from collections import deque
+import Sprite_Cache
+import Pathfinding
+import Map_Grid
 
 class Enemy:
     def __init__(self, fila, col, tile_size, modo="escape"):
@@ -8,11 +8,17 @@ class Enemy:
         self.col = col
         self.fila_spawn = fila
         self.col_spawn = col
+        
+        # Posición anterior para interpolar el dibujo entre ticks
+        self.fila_anterior = fila
+        self.col_anterior = col
         self.tile_size = tile_size
         self.modo = modo
         
         # Determinar rol según modo (opuesto al jugador)
         self.rol = "Hunter" if modo == "escape" else "Runner"
+        # Hunter: P y L / Runner: P, T y E (para escapar)
+        self.mascara_paso = Map_Grid.MASCARAS[self.rol]
         
         # Velocidad
         self.velocidad = 1
@@ -35,47 +41,29 @@ class Enemy:
         self.tiempo_muerte = None
         self.tiempo_reaparicion = 10.0
         
+        # Grilla de ocupación (opcional; solo contiene enemigos vivos)
+        self.ocupacion = None
+        
         # Pathfinding
         self.camino = []
         self.objetivo_anterior = None
+        self.planificador = Pathfinding.planificador(self.rol)
         
         # Para modo Hunter
         self.salida_pos = None
         self.distancia_huida = 5
         
     def cargar_sprites(self):
-        """Carga todos los sprites del enemigo según su rol"""
-        sprites = {}
-        direcciones = ["Up", "Down", "Left", "Right"]
-        
-        for direccion in direcciones:
-            sprites[direccion] = []
-            for num in [1, 2, 3]:
-                ruta = f"ASSETS/SPRITES/Characters/{self.rol}/{self.rol} {direccion} {num}.png"
-                try:
-                    sprite = pygame.image.load(ruta)
-                    sprite = pygame.transform.scale(sprite, (self.tile_size, self.tile_size))
-                    sprites[direccion].append(sprite)
-                except Exception as e:
-                    print(f"Error al cargar sprite enemigo: {ruta} - {e}")
-                    sprite = self.crear_sprite_respaldo()
-                    sprites[direccion].append(sprite)
-        
-        return sprites
-    
-    def crear_sprite_respaldo(self):
-        """Crea un sprite de respaldo si no se pueden cargar las imágenes"""
-        superficie = pygame.Surface((self.tile_size, self.tile_size), pygame.SRCALPHA)
+        """Obtiene los sprites del enemigo según su rol (compartidos desde la caché)"""
+        # Color del sprite de respaldo (círculo) si no se pueden cargar las imágenes
         color = (255, 0, 0) if self.rol == "Hunter" else (0, 255, 0)
-        pygame.draw.circle(superficie, color, 
-                          (self.tile_size // 2, self.tile_size // 2), 
-                          self.tile_size // 3)
-        return superficie
+        return Sprite_Cache.cargar_sprites_personaje(self.rol, self.tile_size, color)
     
     def set_salida(self, salida_pos):
         self.salida_pos = salida_pos
     
-    def actualizar(self, jugador_pos, mapa, tiempo_actual):
+    def actualizar(self, jugador_pos, mapa, tiempo_actual, campo_jugador=None,
+                   mapa_huida=None, campo_salida=None):
         if not self.vivo:
             return
         
@@ -89,10 +77,13 @@ class Enemy:
             # Comportamiento según el modo
             if self.modo == "escape":
                 # Modo Escape: perseguir al jugador
-                self.mover_hacia_jugador(jugador_pos, mapa)
+                if campo_jugador is not None:
+                    self.mover_con_campo(campo_jugador, mapa)
+                else:
+                    self.mover_hacia_jugador(jugador_pos, mapa)
             elif self.modo == "hunter":
                 # Modo Hunter: huir hacia la salida
-                self.huir_hacia_salida(jugador_pos, mapa)
+                self.huir_hacia_salida(jugador_pos, mapa, mapa_huida, campo_salida)
     
     def mover_hacia_jugador(self, jugador_pos, mapa):
         # Si el objetivo cambió, recalcular camino
@@ -104,7 +95,20 @@ class Enemy:
         if self.camino and len(self.camino) > 1:
             self.seguir_camino(mapa)
     
-    def huir_hacia_salida(self, jugador_pos, mapa):
+    def mover_con_campo(self, campo, mapa):
+        """Avanza una casilla siguiendo un campo de distancias compartido"""
+        # Ya está sobre el objetivo
+        if campo.distancia(self.fila, self.col) == 0:
+            return
+
+        siguiente = campo.siguiente_paso(self.fila, self.col)
+        if siguiente is None:
+            return
+
+        self.camino = [(self.fila, self.col), siguiente]
+        self.seguir_camino(mapa)
+    
+    def huir_hacia_salida(self, jugador_pos, mapa, mapa_huida=None, campo_salida=None):
         if not self.salida_pos:
             return
         
@@ -113,11 +117,27 @@ class Enemy:
         
         # Si el jugador está muy cerca, priorizar huir
         if distancia_jugador <= self.distancia_huida:
-            # Huir directamente del jugador
-            self.camino = self.encontrar_camino_huyendo(jugador_pos, mapa)
+            # Bajar por el mapa de huida compartido (rodea al jugador camino a la salida)
+            siguiente = None
+            if mapa_huida is not None:
+                siguiente = mapa_huida.siguiente_paso(self.fila, self.col)
+            
+            if siguiente is not None:
+                self.camino = [(self.fila, self.col), siguiente]
+            else:
+                # Sin camino a la salida: huir directamente del jugador
+                self.camino = self.encontrar_camino_huyendo(jugador_pos, mapa)
+            # Al terminar de huir hay que volver a buscar la salida
+            self.objetivo_anterior = None
         else:
             # Si el jugador está lejos, ir hacia la salida
-            if self.salida_pos != self.objetivo_anterior:
+            if campo_salida is not None:
+                # Campo de distancias a la salida compartido: basta mirar las vecinas
+                siguiente = campo_salida.siguiente_paso(self.fila, self.col)
+                self.camino = [(self.fila, self.col)]
+                if siguiente is not None:
+                    self.camino.append(siguiente)
+            elif self.salida_pos != self.objetivo_anterior:
                 self.camino = self.encontrar_camino_hacia_objetivo(self.salida_pos, mapa)
                 self.objetivo_anterior = self.salida_pos
         
@@ -145,42 +165,25 @@ class Enemy:
             if nueva_fila != self.fila or nueva_col != self.col:
                 self.actualizar_animacion()
                 
-            self.fila = nueva_fila
-            self.col = nueva_col
+            self.mover_a(nueva_fila, nueva_col)
             self.camino.pop(0)
     
     def encontrar_camino_hacia_objetivo(self, objetivo, mapa):
+        """Camino propio hasta el objetivo, para cuando no hay un campo compartido
+
+        En una partida no se usa: Simulation siempre pasa campo_jugador (modo
+        escape) y campo_salida/mapa_huida (modo hunter). Queda para usar un
+        Enemy suelto, sin simulación.
+        """
         inicio = (self.fila, self.col)
         
-        cola = deque([inicio])
-        visitados = {inicio}
-        padres = {inicio: None}
-        
-        while cola:
-            actual = cola.popleft()
-            
-            if actual == objetivo:
-                # Reconstruir camino
-                camino = []
-                while actual is not None:
-                    camino.append(actual)
-                    actual = padres[actual]
-                return list(reversed(camino))
-            
-            # Explorar vecinos (4 direcciones)
-            fila, col = actual
-            for df, dc in [(-1, 0), (1, 0), (0, -1), (0, 1)]:
-                nueva_fila = fila + df
-                nueva_col = col + dc
-                vecino = (nueva_fila, nueva_col)
-                
-                if vecino not in visitados and self.puede_moverse(nueva_fila, nueva_col, mapa):
-                    visitados.add(vecino)
-                    padres[vecino] = actual
-                    cola.append(vecino)
+        # Jump point search con el planificador compartido por rol
+        camino = self.planificador.buscar(inicio, objetivo, mapa)
         
         # Si no hay camino, quedarse quieto
-        return [inicio]
+        if camino is None:
+            return [inicio]
+        return camino
     
     def encontrar_camino_huyendo(self, jugador_pos, mapa):
         inicio = (self.fila, self.col)
@@ -208,18 +211,8 @@ class Enemy:
         return False
     
     def puede_moverse(self, fila, col, mapa):
-        if fila < 0 or fila >= len(mapa) or col < 0 or col >= len(mapa[0]):
-            return False
-        
-        tipo_casilla = mapa[fila][col]
-        if self.modo == "escape":
-            # Enemigos son HUNTERS: pueden pasar por P y L
-            return tipo_casilla in ["P", "L"]
-        elif self.modo == "hunter":
-            # Enemigos son RUNNERS: pueden pasar por P, T y E (para escapar)
-            return tipo_casilla in ["P", "T", "E"]
-        
-        return False
+        # El borde de muros del mapa compacto cubre las casillas fuera de los límites
+        return mapa.es_transitable(fila, col, self.mascara_paso)
     
     def actualizar_animacion(self):
         """Actualiza el frame de animación del sprite (cambia con cada movimiento)"""
@@ -232,6 +225,9 @@ class Enemy:
     def morir(self, tiempo_actual):
         self.vivo = False
         self.tiempo_muerte = tiempo_actual
+        # Un enemigo muerto ya no ocupa su casilla
+        if self.ocupacion is not None:
+            self.ocupacion.quitar(self, (self.fila, self.col))
     
     def puede_reaparecer(self, tiempo_actual):
         if self.vivo:
@@ -246,20 +242,60 @@ class Enemy:
         self.vivo = True
         self.fila = nueva_fila
         self.col = nueva_col
+        self.fila_anterior = nueva_fila
+        self.col_anterior = nueva_col
         self.tiempo_muerte = None
         self.camino = []
         self.objetivo_anterior = None
+        if self.ocupacion is not None:
+            self.ocupacion.agregar(self, (self.fila, self.col))
+    
+    def guardar_posicion_anterior(self):
+        """Guarda la posición al inicio del tick para interpolar el dibujo"""
+        self.fila_anterior = self.fila
+        self.col_anterior = self.col
+    
+    def posicion_interpolada(self, alpha):
+        """Posición (fila, col) entre el tick anterior y el actual (alpha de 0 a 1)"""
+        # Solo se interpola un paso normal; reapariciones y saltos se dibujan directo
+        if abs(self.fila - self.fila_anterior) + abs(self.col - self.col_anterior) != 1:
+            return self.fila, self.col
+        
+        fila = self.fila_anterior + (self.fila - self.fila_anterior) * alpha
+        col = self.col_anterior + (self.col - self.col_anterior) * alpha
+        return fila, col
     
-    def dibujar(self, ventana, margen_x, margen_y):
+    def dibujar(self, ventana, margen_x, margen_y, alpha=1.0):
+        """Dibuja al enemigo y retorna la zona de la ventana que pintó (None si está muerto)"""
         if not self.vivo:
-            return
+            return None
         
-        x = margen_x + (self.col * self.tile_size)
-        y = margen_y + (self.fila * self.tile_size)
+        fila, col = self.posicion_interpolada(alpha)
+        x = margen_x + round(col * self.tile_size)
+        y = margen_y + round(fila * self.tile_size)
         
         sprite = self.sprites[self.direccion][self.frame_actual - 1]
-        ventana.blit(sprite, (x, y))
+        return ventana.blit(sprite, (x, y))
     
     def get_posicion(self):
         """Retorna la posición actual del enemigo como tupla (fila, col)"""
-        return (self.fila, self.col)
\ No newline at end of file
+        return (self.fila, self.col)
+    
+    def set_ocupacion(self, ocupacion):
+        """Registra al enemigo en la grilla de ocupación (se actualiza al moverse)"""
+        self.ocupacion = ocupacion
+        if self.vivo:
+            ocupacion.agregar(self, (self.fila, self.col))
+    
+    def salir_de_ocupacion(self):
+        """Quita al enemigo de la grilla (cuando deja la partida)"""
+        if self.ocupacion is not None and self.vivo:
+            self.ocupacion.quitar(self, (self.fila, self.col))
+        self.ocupacion = None
+    
+    def mover_a(self, fila, col):
+        """Cambia de casilla avisando a la grilla de ocupación"""
+        if self.ocupacion is not None and self.vivo:
+            self.ocupacion.mover(self, (self.fila, self.col), (fila, col))
+        self.fila = fila
+        self.col = col
\ No newline at end of file
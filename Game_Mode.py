@@ -0,0 +1,270 @@
+import pygame
+import sys
+
+from Ending_Screen import EndingScreen
+from Simulation import TICKS_POR_SEGUNDO
+from Map_Layer import MapLayer
+from Map_Generator import MAP_ROWS_GRANDE, MAP_COLS_GRANDE
+from Camera import Camera
+import Music_Manager
+import Sprite_Cache
+import Gif_Cache
+import Display_Format
+import Settings_Manager
+from Dirty_Renderer import DirtyRenderer
+from Countdown import Countdown
+from Dimensiones import ANCHO_VENTANA, ALTO_VENTANA, TILE
+
+
+'''Variables Globales'''
+
+FPS = 60
+
+# Simulación a paso fijo (independiente de los FPS de dibujo)
+DT_SIMULACION = 1 / TICKS_POR_SEGUNDO
+MAX_DT_FRAME = 0.25
+
+# Velocidad de la animación del fondo
+MS_POR_FRAME_FONDO = 100
+
+# MAPA
+MAP_COLS = 24
+MAP_ROWS = 18
+
+# Margen para centrar el mapa
+MARGEN_X = (ANCHO_VENTANA - (MAP_COLS * TILE)) // 2
+MARGEN_Y = (ALTO_VENTANA - (MAP_ROWS * TILE)) // 2
+
+
+class GameMode:
+    """Lo que comparten los modos de juego: dibujado, cámara y bucle de la partida
+
+    Cada modo define:
+    - MUSICA y MODO (el nombre del modo para EndingScreen)
+    - su HUD (timer, points_box, energy_bar y la lista hud) antes de llamar a
+      GameMode.__init__
+    - crear_simulacion(filas, columnas)
+    y puede redefinir dibujar_debajo() y tecla_presionada().
+    """
+
+    MUSICA = None
+    MODO = None
+
+    def __init__(self, ventana, nombre_jugador, num_enemigos=2, velocidad_enemigos=1.0, mapa_grande=False):
+        self.ventana = ventana
+        self.nombre_jugador = nombre_jugador
+        self.reloj = pygame.time.Clock()
+        self.corriendo = True
+
+        # Cargar los frames del GIF (BG_2.gif)
+        self.frames = self.cargar_gif("ASSETS/GIFS/BG_2.gif")
+        self.frame_index = 0
+
+        # Cargar sprites
+        self.cargar_sprites()
+
+        # Capa del laberinto (se construye una vez por mapa)
+        self.capa_mapa = MapLayer(self.sprites, TILE)
+
+        # Cámara: el mapa se ve en el mismo rectángulo de siempre; si es más grande, sigue al jugador
+        self.camara = Camera((MARGEN_X, MARGEN_Y, MAP_COLS * TILE, MAP_ROWS * TILE), TILE)
+
+        # Con el fondo quieto solo se redibuja lo que cambia
+        self.renderer = DirtyRenderer(ventana)
+
+        # Partida (mapa, jugador y enemigos); se crea al ejecutar
+        self.simulacion = None
+
+        # Enemigos - Configuración de dificultad
+        self.num_enemigos = num_enemigos
+        self.velocidad_enemigos = velocidad_enemigos
+        self.mapa_grande = mapa_grande
+
+        # Cuenta regresiva
+        self.countdown = Countdown(ventana, ANCHO_VENTANA, ALTO_VENTANA)
+
+    def cargar_gif(self, ruta):
+        """Frames del fondo desde la caché (solo se decodifican la primera vez)"""
+        return Gif_Cache.cargar_frames(ruta, (ANCHO_VENTANA, ALTO_VENTANA))
+
+    def cargar_sprites(self):
+        """Carga los sprites de los elementos del mapa (desde la caché compartida)"""
+        self.sprites = {}
+        archivos = {"W": "Wall.png", "L": "Vines.png", "T": "Tunnel.png", "E": "Door.png"}
+        # Sprites de respaldo con colores
+        colores_respaldo = {"W": (50, 50, 50), "L": (0, 180, 0), "T": (100, 50, 0), "E": (255, 215, 0)}
+
+        for tipo, archivo in archivos.items():
+            sprite = Sprite_Cache.cargar_sprite(f"ASSETS/SPRITES/{archivo}", (TILE, TILE))
+            if sprite is None:
+                sprite = self.crear_sprite_color(colores_respaldo[tipo])
+            self.sprites[tipo] = sprite
+
+    def crear_sprite_color(self, color):
+        """Crea un sprite simple de color como respaldo"""
+        superficie = pygame.Surface((TILE, TILE))
+        superficie.fill(color)
+        return Display_Format.convertir(superficie, alpha=False)
+
+    def crear_simulacion(self, filas, columnas):
+        """La partida del modo (SimulacionEscape o SimulacionHunter)"""
+        raise NotImplementedError
+
+    def dibujar(self, alpha=1.0, completo=False, presentar=True):
+        # Centrar la cámara en el jugador (en su posición interpolada)
+        jugador = self.simulacion.jugador
+        self.camara.seguir(*jugador.posicion_interpolada(alpha))
+        margen_x, margen_y = self.camara.desplazamiento()
+        self.points_box.points = self.simulacion.puntos
+        self.timer.tiempo_restante = self.simulacion.get_tiempo_restante()
+
+        # Con el fondo animado cambia toda la pantalla: se redibuja completa
+        if completo or Settings_Manager.obtener()["fondo_animado"]:
+            self.renderer.invalidar()
+            self.dibujar_escena_fija(self.ventana)
+            self.dibujar_entidades(margen_x, margen_y, alpha)
+            for widget in self.hud:
+                widget.draw(self.ventana)
+            if presentar:
+                pygame.display.flip()
+            return
+
+        # Fondo quieto: solo se actualizan las entidades y el HUD que cambió
+        self.renderer.comenzar((margen_x, margen_y), self.dibujar_escena_fija)
+        for rect in self.dibujar_entidades(margen_x, margen_y, alpha):
+            self.renderer.entidad(rect)
+        for widget in self.hud:
+            self.renderer.widget(widget)
+        self.renderer.terminar()
+
+    def dibujar_cuenta_regresiva(self):
+        """Escena completa sin mostrarla: la cuenta regresiva dibuja encima y hace el flip"""
+        self.dibujar(completo=True, presentar=False)
+
+    def dibujar_fondo(self, superficie):
+        # Dibujar el GIF de fondo (quieto si la animación está desactivada)
+        if self.frames:
+            if Settings_Manager.obtener()["fondo_animado"]:
+                # El frame del GIF depende del tiempo, no de cuántas veces se dibuja
+                self.frame_index = (pygame.time.get_ticks() // MS_POR_FRAME_FONDO) % len(self.frames)
+            superficie.blit(self.frames[self.frame_index], (0, 0))
+        else:
+            superficie.fill((0, 0, 0))
+
+    def dibujar_escena_fija(self, superficie):
+        """Fondo y mapa: no cambian mientras la cámara no se mueva"""
+        self.dibujar_fondo(superficie)
+
+        # Lo que está fuera de la vista del mapa no se dibuja (sin salirse del clip que ya tenga)
+        clip = superficie.get_clip()
+        superficie.set_clip(clip.clip(self.camara.vista))
+        self.dibujar_mapa(superficie)
+        superficie.set_clip(clip)
+
+    def dibujar_mapa(self, superficie):
+        """Dibuja los trozos pre-renderizados del mapa que están en pantalla"""
+        self.capa_mapa.dibujar(superficie, self.simulacion.mapa, self.camara)
+
+    def dibujar_debajo(self, margen_x, margen_y):
+        """Lo que va debajo de los enemigos; retorna las zonas que pintó"""
+        return []
+
+    def dibujar_entidades(self, margen_x, margen_y, alpha):
+        """Dibuja lo que se mueve y retorna las zonas de la ventana que pintó"""
+        self.ventana.set_clip(self.camara.vista)
+
+        rects = self.dibujar_debajo(margen_x, margen_y)
+
+        # Dibujar enemigos (solo los que están en pantalla)
+        for enemigo in self.simulacion.enemigos:
+            if self.camara.es_visible(*enemigo.posicion_interpolada(alpha)):
+                rect = enemigo.dibujar(self.ventana, margen_x, margen_y, alpha)
+                if rect is not None:
+                    rects.append(rect)
+
+        # Dibujar jugador
+        rects.append(self.simulacion.jugador.dibujar(self.ventana, margen_x, margen_y, alpha))
+
+        self.ventana.set_clip(None)
+        return rects
+
+    def mapa_cambiado(self, fila, col):
+        """Una casilla cambió: en la escena fija guardada se redibuja solo esa casilla"""
+        if fila is None:
+            # Cambió todo el mapa
+            self.renderer.invalidar()
+            return
+
+        margen_x, margen_y = self.camara.desplazamiento()
+        rect = pygame.Rect(margen_x + col * TILE, margen_y + fila * TILE, TILE, TILE).clip(self.camara.vista)
+        if rect.width and rect.height:
+            self.renderer.base_cambiada(rect)
+
+    def tecla_presionada(self, tecla):
+        """Teclas propias del modo (además de ESC)"""
+        pass
+
+    def manejar_eventos(self):
+        for evento in pygame.event.get():
+            if evento.type == pygame.QUIT:
+                pygame.quit()
+                sys.exit()
+            elif evento.type == pygame.KEYDOWN and evento.key == pygame.K_ESCAPE:
+                self.corriendo = False
+            elif evento.type == pygame.KEYDOWN:
+                self.tecla_presionada(evento.key)
+
+    def ejecutar(self):
+        # Crear la partida: mapa, jugador y enemigos en posiciones aleatorias
+        self.simulacion = self.crear_simulacion(
+            MAP_ROWS_GRANDE if self.mapa_grande else MAP_ROWS,
+            MAP_COLS_GRANDE if self.mapa_grande else MAP_COLS
+        )
+        self.camara.ajustar_mapa(self.simulacion.filas, self.simulacion.columnas)
+        self.simulacion.mapa.escuchar(self.mapa_cambiado)
+
+        # Mostrar cuenta regresiva antes de empezar
+        if not self.countdown.ejecutar(self.dibujar_cuenta_regresiva):
+            # Si se canceló la cuenta regresiva, volver al menú
+            return False
+
+        # Iniciar música del modo
+        Music_Manager.reproducir_musica(self.MUSICA)
+
+        # Tiempo real acumulado que todavía no se ha simulado
+        acumulador = 0.0
+
+        while self.corriendo:
+            acumulador += min(self.reloj.get_time() / 1000, MAX_DT_FRAME)
+
+            self.manejar_eventos()
+
+            # Avanzar la partida en ticks fijos con el teclado actual
+            teclas = pygame.key.get_pressed()
+            eventos = []
+            while acumulador >= DT_SIMULACION and self.simulacion.resultado is None:
+                eventos += self.simulacion.paso(teclas, DT_SIMULACION)
+                acumulador -= DT_SIMULACION
+
+            # Un sonido por cada eliminación
+            for evento in eventos:
+                if evento == "eliminado":
+                    Music_Manager.reproducir_efecto("Eliminated")
+
+            # Fin de la partida: se acabó el tiempo, llegó a la salida o fue atrapado
+            if self.simulacion.resultado is not None:
+                # Detener música del modo
+                Music_Manager.detener_musica()
+
+                end = EndingScreen(self.ventana, self.nombre_jugador, self.simulacion.puntos, self.MODO)
+                volver_al_menu = end.run()
+                self.corriendo = False
+                return volver_al_menu
+
+            # Dibujar entre el tick anterior y el actual
+            self.dibujar(acumulador / DT_SIMULACION)
+            self.reloj.tick(FPS)
+
+        # Detener música al salir
+        Music_Manager.detener_musica()
+        return False
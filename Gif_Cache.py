@@ -0,0 +1,156 @@
+import pygame
+import os
+from PIL import Image, ImageSequence
+
+import Display_Format
+
+# Caché de frames de GIF ya decodificados
+# (ruta, tamaño, remuestreo) -> [Surface, ...]
+#
+# La lectura está separada en dos partes: leer_frames() no usa pygame
+# (PIL y archivos, se puede llamar desde el hilo de precarga) y
+# agregar_frames() crea las superficies en el hilo principal.
+gifs_cargados = {}
+
+# Copia opcional en disco de los frames ya redimensionados (RGB sin comprimir).
+# Desactivada por defecto: cada fondo ocupa varios MB en la carpeta de caché del usuario
+CACHE_EN_DISCO = False
+
+
+def carpeta_cache_usuario():
+    """Carpeta de caché del usuario (LOCALAPPDATA en Windows, XDG_CACHE_HOME o ~/.cache)"""
+    base = os.environ.get("LOCALAPPDATA") or os.environ.get("XDG_CACHE_HOME")
+    if not base:
+        base = os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(base, "Escapa-del-Laberinto", "gifs")
+
+
+CARPETA_CACHE = carpeta_cache_usuario()
+
+
+def cargar_frames(ruta, tamaño, remuestreo=None):
+    """Devuelve los frames del GIF escalados a 'tamaño', decodificándolo una sola vez"""
+    clave = (ruta, tamaño, remuestreo)
+    if clave not in gifs_cargados:
+        agregar_frames(ruta, tamaño, remuestreo, leer_frames(ruta, tamaño, remuestreo))
+    return gifs_cargados[clave]
+
+
+def leer_frames(ruta, tamaño, remuestreo=None):
+    """Bytes RGB de cada frame escalado (None si no se pudo leer); no usa pygame"""
+    datos = None
+    if CACHE_EN_DISCO:
+        datos = leer_cache_disco(ruta, tamaño, remuestreo)
+
+    if datos is None:
+        try:
+            datos = decodificar_gif(ruta, tamaño, remuestreo)
+            if CACHE_EN_DISCO:
+                guardar_cache_disco(ruta, tamaño, remuestreo, datos)
+        except Exception as e:
+            print(f"Error al cargar GIF: {e}")
+    return datos
+
+
+def agregar_frames(ruta, tamaño, remuestreo, datos):
+    """Crea las superficies de leer_frames() y las guarda en la caché (hilo principal)"""
+    for _ in crear_frames(ruta, tamaño, remuestreo, datos):
+        pass
+
+
+def crear_frames(ruta, tamaño, remuestreo, datos):
+    """Como agregar_frames(), pero de a un frame por cada next()
+
+    Así la precarga puede repartir un GIF largo entre varios frames de la
+    pantalla de carga. El GIF entra en la caché recién con el último frame.
+    """
+    frames = []
+    if datos is None:
+        frame_negro = pygame.Surface(tamaño)
+        frame_negro.fill((0, 0, 0))
+        frames.append(convertir_frame(frame_negro))
+    else:
+        for bloque in datos:
+            # frombuffer no copia los bytes: la única copia es la de convertir_frame()
+            frames.append(convertir_frame(pygame.image.frombuffer(bloque, tamaño, "RGB")))
+            yield
+
+    gifs_cargados[(ruta, tamaño, remuestreo)] = frames
+
+
+def decodificar_gif(ruta, tamaño, remuestreo):
+    datos = []
+    with Image.open(ruta) as imagen:
+        for frame in ImageSequence.Iterator(imagen):
+            # Los fondos son opacos: se decodifican directamente en RGB
+            frame = frame.convert("RGB")
+            if remuestreo is None:
+                frame = frame.resize(tamaño)
+            else:
+                frame = frame.resize(tamaño, remuestreo)
+            datos.append(frame.tobytes())
+    return datos
+
+
+def convertir_frame(frame):
+    """Pasa el frame al formato de la pantalla para que el blit sea directo (los fondos son opacos)"""
+    return Display_Format.convertir(frame, alpha=False)
+
+
+def reconvertir():
+    """Pasa al formato de la ventana los frames que ya están en la caché"""
+    for frames in gifs_cargados.values():
+        frames[:] = [convertir_frame(frame) for frame in frames]
+
+
+def ruta_cache_disco(ruta, tamaño, remuestreo):
+    # El nombre incluye la fecha y el tamaño del GIF para detectar cambios
+    info = os.stat(ruta)
+    nombre = os.path.splitext(os.path.basename(ruta))[0]
+    filtro = "def" if remuestreo is None else int(remuestreo)
+    return os.path.join(
+        CARPETA_CACHE,
+        f"{nombre}_{tamaño[0]}x{tamaño[1]}_{filtro}_{info.st_mtime_ns}_{info.st_size}.raw"
+    )
+
+
+def leer_cache_disco(ruta, tamaño, remuestreo):
+    """Frames guardados en disco, o None si no hay una copia válida (se decodifica el GIF)"""
+    try:
+        archivo = ruta_cache_disco(ruta, tamaño, remuestreo)
+        with open(archivo, "rb") as f:
+            datos = f.read()
+    except OSError:
+        # Todavía no hay copia en disco (o no existe el GIF): no es un error
+        return None
+
+    bytes_por_frame = tamaño[0] * tamaño[1] * 3
+    if not datos or len(datos) % bytes_por_frame != 0:
+        return None
+
+    return [datos[inicio:inicio + bytes_por_frame]
+            for inicio in range(0, len(datos), bytes_por_frame)]
+
+
+def guardar_cache_disco(ruta, tamaño, remuestreo, datos):
+    try:
+        archivo = ruta_cache_disco(ruta, tamaño, remuestreo)
+        os.makedirs(CARPETA_CACHE, exist_ok=True)
+
+        # Borrar copias viejas del mismo GIF (otra fecha o tamaño de archivo)
+        prefijo = os.path.basename(archivo).rsplit("_", 2)[0] + "_"
+        for viejo in os.listdir(CARPETA_CACHE):
+            if viejo.startswith(prefijo) and viejo != os.path.basename(archivo):
+                os.remove(os.path.join(CARPETA_CACHE, viejo))
+
+        # Escribir en un temporal y renombrar para no dejar archivos a medias
+        temporal = archivo + ".tmp"
+        with open(temporal, "wb") as f:
+            for bloque in datos:
+                f.write(bloque)
+        os.replace(temporal, archivo)
+    except Exception as e:
+        print(f"Error al guardar la caché del GIF: {e}")
+
+
+Display_Format.al_crear_ventana.append(reconvertir)
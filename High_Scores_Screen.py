@@ -1,7 +1,7 @@
 import pygame
 import sys
-import os
-import json
+import Text_Cache
+from Leaderboard import leaderboard
 
 # Constantes
 ANCHO_VENTANA = 800
@@ -25,7 +25,7 @@ class Boton:
         pygame.draw.rect(ventana, NEGRO, self.rect)
         pygame.draw.rect(ventana, BLANCO, self.rect, 2)
         color_texto = VERDE_CLARO if self.hover else BLANCO
-        texto_surface = self.fuente.render(self.texto, True, color_texto)
+        texto_surface = Text_Cache.renderizar(self.fuente, self.texto, True, color_texto)
         texto_rect = texto_surface.get_rect(center=self.rect.center)
         ventana.blit(texto_surface, texto_rect)
         
@@ -68,11 +68,11 @@ class HighScoresScreen:
     def dibujar(self):
         self.ventana.fill(NEGRO)
         
-        texto_titulo = self.fuente_titulo.render("MEJORES PUNTAJES", True, BLANCO)
+        texto_titulo = Text_Cache.renderizar(self.fuente_titulo, "MEJORES PUNTAJES", True, BLANCO)
         rect_titulo = texto_titulo.get_rect(center=(ANCHO_VENTANA // 2, 100))
         self.ventana.blit(texto_titulo, rect_titulo)
         
-        texto_subtitulo = self.fuente_subtitulo.render("Selecciona el modo:", True, BLANCO)
+        texto_subtitulo = Text_Cache.renderizar(self.fuente_subtitulo, "Selecciona el modo:", True, BLANCO)
         rect_subtitulo = texto_subtitulo.get_rect(center=(ANCHO_VENTANA // 2, 160))
         self.ventana.blit(texto_subtitulo, rect_subtitulo)
         
@@ -119,21 +119,13 @@ class TopScoresScreen:
         self.fuente_texto = pygame.font.Font(None, 40)
         self.fuente_boton = pygame.font.Font(None, 36)
         
-        # Usar el mismo archivo JSON que EndingScreen
-        self.archivo = f"scores_{self.modo}.json"
-        
         self.crear_botones()
         self.puntajes = self.cargar_puntajes()
         
     def cargar_puntajes(self):
-        """Carga los puntajes desde el archivo JSON"""
-        if not os.path.exists(self.archivo):
-            return []
-        
+        """Carga los 5 mejores puntajes del modo desde la tabla de puntajes"""
         try:
-            with open(self.archivo, "r") as f:
-                data = json.load(f)
-                return data
+            return leaderboard.obtener_top(self.modo, 5)
         except Exception as e:
             print(f"Error al cargar puntajes: {e}")
             return []
@@ -150,12 +142,12 @@ class TopScoresScreen:
         
         # Título con nombre del modo
         modo_texto = "ESCAPA" if self.modo == "escape" else "CAZADOR"
-        texto_titulo = self.fuente_titulo.render(f"TOP 5 - {modo_texto}", True, BLANCO)
+        texto_titulo = Text_Cache.renderizar(self.fuente_titulo, f"TOP 5 - {modo_texto}", True, BLANCO)
         rect_titulo = texto_titulo.get_rect(center=(ANCHO_VENTANA // 2, 80))
         self.ventana.blit(texto_titulo, rect_titulo)
         
         if not self.puntajes:
-            texto_vacio = self.fuente_texto.render("No hay puntajes registrados", True, NARANJA)
+            texto_vacio = Text_Cache.renderizar(self.fuente_texto, "No hay puntajes registrados", True, NARANJA)
             rect_vacio = texto_vacio.get_rect(center=(ANCHO_VENTANA // 2, ALTO_VENTANA // 2))
             self.ventana.blit(texto_vacio, rect_vacio)
         else:
@@ -163,7 +155,7 @@ class TopScoresScreen:
             for i, score_data in enumerate(self.puntajes[:5]):
                 nombre = score_data.get("name", "Desconocido")
                 puntaje = score_data.get("score", 0)
-                texto_puntaje = self.fuente_texto.render(
+                texto_puntaje = Text_Cache.renderizar(self.fuente_texto,
                     f"{i+1}. {nombre} - {puntaje}", 
                     True, 
                     BLANCO
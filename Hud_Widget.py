@@ -0,0 +1,45 @@
+import pygame
+
+import Display_Format
+
+'''Widgets del HUD con superficie propia
+
+Cada widget se dibuja en su propia superficie solo cuando cambia lo que
+muestra (su estado(): el ancho en píxeles de una barra, los puntos...).
+El resto de los frames dibujarlo es un único blit. La superficie se crea
+una sola vez y se limpia y redibuja en su lugar.
+'''
+
+
+class HudWidget:
+    """Base de los widgets del HUD
+
+    Las subclases definen x, y, width, height, estado() y
+    renderizar(superficie, estado), que dibuja el widget con su esquina
+    superior izquierda en (0, 0).
+    """
+
+    superficie = None
+    estado_dibujado = None
+
+    def obtener_superficie(self, estado=None):
+        """La superficie del widget, redibujada solo si cambió su estado
+
+        Quien ya calculó estado() lo pasa, así se dibuja exactamente lo que
+        se comparó (el de TimerBar, por ejemplo, cambia con el tiempo).
+        """
+        if estado is None:
+            estado = self.estado()
+        if self.superficie is None:
+            self.superficie = Display_Format.convertir(
+                pygame.Surface((self.width, self.height), pygame.SRCALPHA), alpha=True)
+        elif estado == self.estado_dibujado:
+            return self.superficie
+
+        self.superficie.fill((0, 0, 0, 0))
+        self.renderizar(self.superficie, estado)
+        self.estado_dibujado = estado
+        return self.superficie
+
+    def draw(self, pantalla, estado=None):
+        pantalla.blit(self.obtener_superficie(estado), (self.x, self.y))
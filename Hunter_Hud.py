@@ -1,41 +1,30 @@
 import pygame
-import time
+import Text_Cache
+from Hud_Widget import HudWidget
 
-class TimerBar1:
+class TimerBar1(HudWidget):
     def __init__(self, duracion, x, y, width=400, height=40):
         self.duracion = duracion
         self.x = x
         self.y = y
         self.width = width
         self.height = height
-        self.inicio = None
-        self.iniciado = False
+        # Lo pone el modo en cada frame desde la simulación (Simulacion.get_tiempo_restante)
+        self.tiempo_restante = duracion
 
         self.VERDE = (0, 255, 0)
         self.AMARILLO = (255, 255, 0)
         self.ROJO = (255, 0, 0)
         self.BLANCO = (255, 255, 255)
 
-    def start(self):
-        if not self.iniciado:
-            self.inicio = time.time()
-            self.iniciado = True
-
-    def reset(self):
-        self.inicio = time.time()
-        self.iniciado = True
-
     def get_remaining_time(self):
-        if not self.iniciado or self.inicio is None:
-            return self.duracion
-        return max(self.duracion - (time.time() - self.inicio), 0)
+        return self.tiempo_restante
 
     def is_finished(self):
-        if not self.iniciado:
-            return False
-        return self.get_remaining_time() <= 0
+        return self.tiempo_restante <= 0
 
-    def draw(self, pantalla):
+    def estado(self):
+        """Lo que se ve de la barra (ancho en píxeles y color): si no cambia, no hay que redibujarla"""
         tiempo_restante = self.get_remaining_time()
         progreso = tiempo_restante / self.duracion
 
@@ -46,13 +35,16 @@ class TimerBar1:
         else:
             color = self.ROJO
 
-        ancho_actual = int(self.width * progreso)
+        return int(self.width * progreso), color
+
+    def renderizar(self, superficie, estado):
+        ancho_actual, color = estado
 
-        pygame.draw.rect(pantalla, self.BLANCO, (self.x, self.y, self.width, self.height), 3)
-        pygame.draw.rect(pantalla, color, (self.x, self.y, ancho_actual, self.height))
+        pygame.draw.rect(superficie, self.BLANCO, (0, 0, self.width, self.height), 3)
+        pygame.draw.rect(superficie, color, (0, 0, ancho_actual, self.height))
 
 
-class PointsBox1:
+class PointsBox1(HudWidget):
     def __init__(self, x, y, width, height, initial_points=0):
         self.points = initial_points
         self.x = x
@@ -69,16 +61,19 @@ class PointsBox1:
     def add_points(self, amount):
         self.points += amount
 
-    def draw(self, pantalla):
-        pygame.draw.rect(pantalla, self.BLACK, (self.x, self.y, self.width, self.height), border_radius=4)
-        pygame.draw.rect(pantalla, self.WHITE, (self.x, self.y, self.width, self.height), 2, border_radius=4)
+    def estado(self):
+        return self.points
 
-        text = self.font.render(f"Puntos: {self.points}", True, self.WHITE)
-        text_rect = text.get_rect(center=(self.x + self.width//2, self.y + self.height//2))
+    def renderizar(self, superficie, puntos):
+        pygame.draw.rect(superficie, self.BLACK, (0, 0, self.width, self.height), border_radius=4)
+        pygame.draw.rect(superficie, self.WHITE, (0, 0, self.width, self.height), 2, border_radius=4)
 
-        pantalla.blit(text, text_rect)
+        text = Text_Cache.renderizar(self.font, f"Puntos: {puntos}", True, self.WHITE)
+        text_rect = text.get_rect(center=(self.width//2, self.height//2))
 
-class EnergyBar1:
+        superficie.blit(text, text_rect)
+
+class EnergyBar1(HudWidget):
     def __init__(self, max_energy, x, y, width=200, height=15):
         self.max_energy = max_energy
         self.energy = max_energy
@@ -104,7 +99,8 @@ class EnergyBar1:
         self.energy += self.recover_speed * dt
         self.energy = min(self.energy, self.max_energy)
 
-    def draw(self, pantalla):
+    def estado(self):
+        """Lo que se ve de la barra (ancho en píxeles y color)"""
         porcentaje = self.energy / self.max_energy
         width_actual = int(self.width * porcentaje)
 
@@ -115,5 +111,10 @@ class EnergyBar1:
         else:
             color = self.YELLOW
 
-        pygame.draw.rect(pantalla, self.WHITE, (self.x, self.y, self.width, self.height), 3)
-        pygame.draw.rect(pantalla, color, (self.x, self.y, width_actual, self.height))
\ No newline at end of file
+        return width_actual, color
+
+    def renderizar(self, superficie, estado):
+        width_actual, color = estado
+
+        pygame.draw.rect(superficie, self.WHITE, (0, 0, self.width, self.height), 3)
+        pygame.draw.rect(superficie, color, (0, 0, width_actual, self.height))
\ No newline at end of file
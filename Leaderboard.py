@@ -0,0 +1,166 @@
+import atexit
+import json
+import os
+import queue
+import sqlite3
+import threading
+import time
+
+ARCHIVO_DB = "scores.db"
+MODOS = ("escape", "hunter")
+
+
+class Leaderboard:
+    """Historial completo de puntajes guardado en SQLite (modo WAL)
+
+    - Las consultas de top-K y por jugador usan índices, así que su costo no
+      crece con el tamaño del historial.
+    - Las escrituras se encolan y las hace un hilo aparte: la pantalla final
+      nunca espera al disco.
+    - La primera vez se importan los antiguos scores_{modo}.json.
+    """
+
+    def __init__(self, archivo=ARCHIVO_DB):
+        self.archivo = archivo
+        # Conexión de lectura (se usa desde el hilo principal)
+        self.conexion = None
+        self.pendientes = queue.Queue()
+        self.hilo = None
+        self.lock = threading.Lock()
+
+    def conectar(self):
+        conexion = sqlite3.connect(self.archivo)
+        conexion.execute("PRAGMA journal_mode=WAL")
+        conexion.execute("PRAGMA synchronous=NORMAL")
+        return conexion
+
+    def abrir(self):
+        """Abre la base (creando tablas e índices si hace falta) y arranca el hilo escritor"""
+        with self.lock:
+            if self.conexion is not None:
+                return self.conexion
+
+            conexion = self.conectar()
+            with conexion:
+                conexion.execute(
+                    "CREATE TABLE IF NOT EXISTS puntajes ("
+                    "id INTEGER PRIMARY KEY, modo TEXT NOT NULL, nombre TEXT NOT NULL, "
+                    "puntaje INTEGER NOT NULL, fecha REAL NOT NULL)"
+                )
+                conexion.execute(
+                    "CREATE INDEX IF NOT EXISTS idx_modo_puntaje ON puntajes (modo, puntaje DESC, id)"
+                )
+                conexion.execute(
+                    "CREATE INDEX IF NOT EXISTS idx_modo_nombre ON puntajes (modo, nombre, puntaje DESC)"
+                )
+                if conexion.execute("PRAGMA user_version").fetchone()[0] == 0:
+                    importar_json(conexion)
+                    conexion.execute("PRAGMA user_version = 1")
+
+            self.conexion = conexion
+            self.hilo = threading.Thread(target=self.escribir, daemon=True)
+            self.hilo.start()
+            return conexion
+
+    def registrar(self, modo, nombre, puntaje):
+        """Encola un puntaje; se guarda en segundo plano"""
+        self.abrir()
+        self.pendientes.put((modo, nombre, int(puntaje), time.time()))
+
+    def escribir(self):
+        conexion = self.conectar()
+        while True:
+            registro = self.pendientes.get()
+            if registro is None:
+                self.pendientes.task_done()
+                break
+
+            # Agrupar en una sola transacción todo lo que esté en cola
+            registros = [registro]
+            while True:
+                try:
+                    registro = self.pendientes.get_nowait()
+                except queue.Empty:
+                    break
+                if registro is None:
+                    self.pendientes.put(None)
+                    self.pendientes.task_done()
+                    break
+                registros.append(registro)
+
+            try:
+                with conexion:
+                    conexion.executemany(
+                        "INSERT INTO puntajes (modo, nombre, puntaje, fecha) VALUES (?, ?, ?, ?)",
+                        registros
+                    )
+            except sqlite3.Error as e:
+                print(f"Error al guardar puntajes: {e}")
+            for _ in registros:
+                self.pendientes.task_done()
+        conexion.close()
+
+    def esperar(self):
+        """Bloquea hasta que todas las escrituras encoladas estén en el disco"""
+        if self.hilo is not None:
+            self.pendientes.join()
+
+    def cerrar(self):
+        """Termina de escribir lo pendiente y detiene el hilo escritor"""
+        if self.hilo is not None and self.hilo.is_alive():
+            self.pendientes.put(None)
+            self.hilo.join()
+
+    def obtener_top(self, modo, cantidad=5):
+        """Los mejores puntajes del modo como [{"name": ..., "score": ...}]"""
+        filas = self.abrir().execute(
+            "SELECT nombre, puntaje FROM puntajes WHERE modo = ? "
+            "ORDER BY puntaje DESC, id LIMIT ?",
+            (modo, cantidad)
+        ).fetchall()
+        return [{"name": nombre, "score": puntaje} for nombre, puntaje in filas]
+
+    def mejor_de_jugador(self, modo, nombre):
+        """Mejor puntaje del jugador en el modo, o None si no tiene partidas"""
+        fila = self.abrir().execute(
+            "SELECT MAX(puntaje) FROM puntajes WHERE modo = ? AND nombre = ?",
+            (modo, nombre)
+        ).fetchone()
+        return fila[0]
+
+    def historial_jugador(self, modo, nombre, cantidad=10):
+        """Mejores puntajes del jugador en el modo, de mayor a menor"""
+        filas = self.abrir().execute(
+            "SELECT puntaje FROM puntajes WHERE modo = ? AND nombre = ? "
+            "ORDER BY puntaje DESC LIMIT ?",
+            (modo, nombre, cantidad)
+        ).fetchall()
+        return [puntaje for (puntaje,) in filas]
+
+
+def importar_json(conexion):
+    """Copia a la base los puntajes de los antiguos scores_{modo}.json"""
+    for modo in MODOS:
+        archivo = f"scores_{modo}.json"
+        if not os.path.exists(archivo):
+            continue
+        try:
+            with open(archivo, "r") as f:
+                data = json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"Error al importar {archivo}: {e}")
+            continue
+
+        fecha = os.path.getmtime(archivo)
+        conexion.executemany(
+            "INSERT INTO puntajes (modo, nombre, puntaje, fecha) VALUES (?, ?, ?, ?)",
+            [(modo, datos.get("name", "Desconocido"), int(datos.get("score", 0)), fecha)
+             for datos in data]
+        )
+
+
+# Tabla compartida por todo el juego
+leaderboard = Leaderboard()
+
+# Guardar lo pendiente al cerrar el juego
+atexit.register(leaderboard.cerrar)
@@ -5,6 +5,10 @@ from High_Scores_Screen import HighScoresScreen
 from Settings_Screen import SettingsScreen
 from Play import PlayScreen
 from Music_Manager import reproducir_musica, detener_musica
+import Gif_Cache
+import Display_Format
+import Text_Cache
+from Asset_Preloader import AssetPreloader
 
 # Inicializar Pygame
 pygame.init()
@@ -34,7 +38,7 @@ class Boton:
         pygame.draw.rect(ventana, NEGRO, self.rect)
         pygame.draw.rect(ventana, BLANCO, self.rect, 2)
         color_texto = VERDE_CLARO if self.hover else BLANCO
-        texto_surface = self.fuente.render(self.texto, True, color_texto)
+        texto_surface = Text_Cache.renderizar(self.fuente, self.texto, True, color_texto)
         texto_rect = texto_surface.get_rect(center=self.rect.center)
         ventana.blit(texto_surface, texto_rect)
 
@@ -54,22 +58,7 @@ class GifAnimado:
         self.cargar_gif(ruta_gif)
 
     def cargar_gif(self, ruta_gif):
-        try:
-            gif = Image.open(ruta_gif)
-            for frame_num in range(gif.n_frames):
-                gif.seek(frame_num)
-                frame = gif.convert("RGBA")
-                frame = frame.resize((ANCHO_VENTANA, ALTO_VENTANA), Image.LANCZOS)
-                modo = frame.mode
-                tamaño = frame.size
-                datos = frame.tobytes()
-                py_frame = pygame.image.fromstring(datos, tamaño, modo)
-                self.frames.append(py_frame)
-        except Exception as e:
-            print(f"Error al cargar GIF: {e}")
-            frame_negro = pygame.Surface((ANCHO_VENTANA, ALTO_VENTANA))
-            frame_negro.fill(NEGRO)
-            self.frames.append(frame_negro)
+        self.frames = Gif_Cache.cargar_frames(ruta_gif, (ANCHO_VENTANA, ALTO_VENTANA), Image.LANCZOS)
 
     def actualizar(self):
         if len(self.frames) <= 1:
@@ -86,7 +75,7 @@ class GifAnimado:
 
 class MainScreen:
     def __init__(self):
-        self.ventana = pygame.display.set_mode((ANCHO_VENTANA, ALTO_VENTANA))
+        self.ventana = Display_Format.crear_ventana((ANCHO_VENTANA, ALTO_VENTANA))
         pygame.display.set_caption("Escapa del Laberinto")
         self.reloj = pygame.time.Clock()
         self.corriendo = True
@@ -95,15 +84,35 @@ class MainScreen:
         self.fuente_titulo = pygame.font.Font(None, 80)
         self.fuente_boton = pygame.font.Font(None, 36)
 
-        # Fondo animado
-        self.fondo_gif = GifAnimado("ASSETS/GIFS/BG_1.gif")
-
-        # Música del menú
-        self.cargar_musica()
+        # Los recursos se cargan en otro hilo mientras se muestra el progreso;
+        # el fondo y la música del menú se crean al terminar
+        self.fondo_gif = None
+        self.precarga = AssetPreloader()
+        self.precarga.iniciar()
 
         # Crear botones
         self.crear_botones()
 
+    def actualizar_carga(self):
+        self.precarga.procesar()
+        if self.precarga.terminado():
+            # Ya está todo en las cachés: esto no lee el disco
+            self.fondo_gif = GifAnimado("ASSETS/GIFS/BG_1.gif")
+            self.cargar_musica()
+
+    def dibujar_carga(self):
+        self.ventana.fill(NEGRO)
+
+        texto = Text_Cache.renderizar(self.fuente_boton, "Cargando...", True, BLANCO)
+        self.ventana.blit(texto, texto.get_rect(center=(ANCHO_VENTANA // 2, ALTO_VENTANA // 2 - 30)))
+
+        ancho_barra = 400
+        barra = pygame.Rect(ANCHO_VENTANA // 2 - ancho_barra // 2, ALTO_VENTANA // 2, ancho_barra, 20)
+        pygame.draw.rect(self.ventana, VERDE_OSCURO, (barra.x, barra.y, int(barra.width * self.precarga.progreso()), barra.height))
+        pygame.draw.rect(self.ventana, BLANCO, barra, 2)
+
+        pygame.display.flip()
+
     def cargar_musica(self):
         reproducir_musica("ASSETS/OST/Main_Theme.mp3")
 
@@ -126,10 +135,10 @@ class MainScreen:
         self.fondo_gif.dibujar(self.ventana)
 
         # Título con sombra
-        texto_sombra = self.fuente_titulo.render("ESCAPA DEL", True, (40, 40, 40))
-        texto_titulo = self.fuente_titulo.render("ESCAPA DEL", True, BLANCO)
-        texto_sombra2 = self.fuente_titulo.render("LABERINTO", True, (40, 40, 40))
-        texto_titulo2 = self.fuente_titulo.render("LABERINTO", True, BLANCO)
+        texto_sombra = Text_Cache.renderizar(self.fuente_titulo, "ESCAPA DEL", True, (40, 40, 40))
+        texto_titulo = Text_Cache.renderizar(self.fuente_titulo, "ESCAPA DEL", True, BLANCO)
+        texto_sombra2 = Text_Cache.renderizar(self.fuente_titulo, "LABERINTO", True, (40, 40, 40))
+        texto_titulo2 = Text_Cache.renderizar(self.fuente_titulo, "LABERINTO", True, BLANCO)
 
         rect_titulo = texto_titulo.get_rect(center=(ANCHO_VENTANA // 2, 100))
         rect_titulo2 = texto_titulo2.get_rect(center=(ANCHO_VENTANA // 2, 170))
@@ -169,10 +178,14 @@ class MainScreen:
             for evento in pygame.event.get():
                 if evento.type == pygame.QUIT:
                     self.corriendo = False
-                elif evento.type == pygame.MOUSEBUTTONDOWN and evento.button == 1:
+                elif evento.type == pygame.MOUSEBUTTONDOWN and evento.button == 1 and self.fondo_gif is not None:
                     self.manejar_click(evento.pos)
 
-            self.dibujar_menu_principal()
+            if self.fondo_gif is None:
+                self.actualizar_carga()
+                self.dibujar_carga()
+            else:
+                self.dibujar_menu_principal()
             self.reloj.tick(FPS)
 
         pygame.quit()
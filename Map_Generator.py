@@ -0,0 +1,255 @@
+import random
+
+from Map_Grid import Grid
+from Map_Regions import regiones
+from Pathfinding import TRANSITABLES
+
+'''Generación por lotes
+
+El mapa se arma directamente en el formato de Map_Grid (un byte por casilla
+con borde de muros). En lugar de recorrer casilla por casilla, cada paso
+trabaja con máscaras del mapa entero (un byte 0/1 por casilla):
+
+- bytes aleatorios de rng.randbytes pasados por una tabla dan una máscara
+  con probabilidad p por casilla,
+- las máscaras se combinan como enteros grandes (&, |) y se desplazan con
+  slices para mirar a las vecinas,
+- bytes.translate y bytes.count reemplazan los bucles de conteo.
+'''
+
+# MAPA
+MAP_COLS = 24
+MAP_ROWS = 18
+
+# Mapa grande (se recorre con la cámara)
+MAP_COLS_GRANDE = 96
+MAP_ROWS_GRANDE = 72
+
+# Proporción de muros sobre las casillas interiores y de lianas/túneles sobre los caminos
+PROPORCION_MUROS = (0.30, 0.40)
+PROPORCION_LIANAS = (0.10, 0.15)
+PROPORCION_TUNELES = (0.10, 0.15)
+
+# Algunos muros forman grupos pequeños con 1 o 2 vecinos
+PROBABILIDAD_GRUPO = 0.3
+PROBABILIDAD_VECINO_GRUPO = 0.375
+
+# Casillas mínimas de la región donde aparecen los enemigos
+MIN_REGION_ENEMIGOS = 20
+# Mapas a generar antes de rendirse si ninguno es válido
+MAX_INTENTOS = 10
+
+
+def generar_mapa(modo, filas=MAP_ROWS, columnas=MAP_COLS, rng=random):
+    """Genera un laberinto aleatorio con bordes de muros
+
+    Toda la aleatoriedad sale de 'rng' (por ejemplo random.Random(semilla)),
+    así que la misma semilla siempre produce el mismo mapa.
+
+    Retorna (mapa, inicio, salida), con el mapa en formato compacto (Map_Grid.Grid).
+    Se descartan los mapas sin camino a la salida o en los que la región de
+    los enemigos no es la principal de su rol; las regiones calculadas para
+    validarlo quedan guardadas en el mapa (Map_Regions) y las reutilizan los
+    enemigos y el pathfinding.
+    """
+    for _ in range(MAX_INTENTOS):
+        mapa, inicio, salida = construir_mapa(modo, filas, columnas, rng)
+        if es_valido(mapa, modo, inicio, salida):
+            return mapa, inicio, salida
+
+    raise RuntimeError(f"No se pudo generar un mapa válido de {filas}x{columnas}")
+
+
+def construir_mapa(modo, filas, columnas, rng=random):
+    """Un intento de generar_mapa, sin validar"""
+
+    # Definir inicio y salida (dentro de los bordes)
+    if modo == "escape":
+        inicio_fila = rng.randint(2, filas - 3)
+        inicio_col = 2
+
+        salida_fila = rng.randint(2, filas - 3)
+        salida_col = columnas - 3
+    else:
+        # Jugador empieza CERCA de la salida para interceptar enemigos
+        salida_fila = rng.randint(2, filas - 3)
+        salida_col = columnas - 3
+
+        # Jugador aparece cerca de la salida (entre 2-4 casillas)
+        inicio_fila = salida_fila
+        inicio_col = salida_col - rng.randint(2, 4)
+
+    inicio = (inicio_fila, inicio_col)
+    salida = (salida_fila, salida_col)
+
+    # Todo camino, con un marco de muros (el marco es lo que no es interior)
+    mapa = Grid(filas, columnas, relleno="W")
+    poner_tipo(mapa, mascara_interior(mapa, 1), "P")
+
+    # Crear camino garantizado a la salida
+    camino_garantizado = crear_camino_garantizado(inicio_fila, inicio_col,
+                                                  salida_fila, salida_col, rng)
+
+    # Zona donde se pueden poner muros, lianas y túneles: el interior sin el
+    # camino garantizado ni las casillas alrededor del inicio y la salida
+    zona = mascara_interior(mapa, 2)
+    for fila, col in camino_garantizado:
+        zona[mapa.indice(fila, col)] = 0
+    for centro_fila, centro_col in (inicio, salida):
+        for fila in range(centro_fila - 1, centro_fila + 2):
+            for col in range(centro_col - 1, centro_col + 2):
+                zona[mapa.indice(fila, col)] = 0
+
+    # Agregar muros en patrón equilibrado
+    agregar_muros_equilibrados(mapa, zona, camino_garantizado, rng)
+
+    # Agregar lianas y túneles
+    agregar_elementos_tacticos(mapa, zona, rng)
+
+    # Asegurar que inicio y salida estén despejados
+    mapa.poner(inicio_fila, inicio_col, "P")
+    mapa.poner(salida_fila, salida_col, "E")
+
+    return mapa, inicio, salida
+
+
+def crear_camino_garantizado(inicio_fila, inicio_col, salida_fila, salida_col, rng=random):
+    """Crea un camino garantizado desde inicio hasta salida"""
+    camino = set()
+    fila, col = inicio_fila, inicio_col
+
+    while col < salida_col or fila != salida_fila:
+        camino.add((fila, col))
+
+        # Decidir dirección
+        if col < salida_col and rng.random() < 0.7:
+            col += 1
+        elif fila < salida_fila:
+            fila += 1
+        elif fila > salida_fila:
+            fila -= 1
+        elif col < salida_col:
+            col += 1
+
+    camino.add((salida_fila, salida_col))
+    return camino
+
+
+# --- Máscaras (un byte 0/1 por casilla, mismos índices que Map_Grid) ---
+
+def mascara_interior(mapa, margen):
+    """1 en las casillas a 'margen' o más casillas del borde del mapa"""
+    fila_vacia = bytes(mapa.ancho)
+    fila_interior = bytes(margen + 1) + b"\x01" * (mapa.columnas - 2 * margen) + bytes(margen + 1)
+    filas_interiores = mapa.filas - 2 * margen
+    return bytearray(fila_vacia * (margen + 1) + fila_interior * filas_interiores + fila_vacia * (margen + 1))
+
+
+def mascara_aleatoria(rng, tamaño, probabilidad):
+    """1 en cada casilla con la probabilidad dada (en pasos de 1/256)"""
+    umbral = max(0, min(256, round(probabilidad * 256)))
+    tabla = bytes(1 if valor < umbral else 0 for valor in range(256))
+    return rng.randbytes(tamaño).translate(tabla)
+
+
+def mascara_de_tipo(mapa, tipo):
+    tabla = bytearray(256)
+    tabla[ord(tipo)] = 1
+    return mapa.celdas.translate(tabla)
+
+
+def y(a, b):
+    return (int.from_bytes(a, "little") & int.from_bytes(b, "little")).to_bytes(len(a), "little")
+
+
+def o(a, b):
+    return (int.from_bytes(a, "little") | int.from_bytes(b, "little")).to_bytes(len(a), "little")
+
+
+def desplazar(mascara, pasos):
+    """La máscara movida 'pasos' índices (1 = una columna, ancho = una fila)"""
+    if pasos > 0:
+        return bytes(pasos) + mascara[:-pasos]
+    return mascara[-pasos:] + bytes(-pasos)
+
+
+def poner_tipo(mapa, mascara, tipo):
+    """Pone 'tipo' en todas las casillas marcadas de la máscara"""
+    celdas = int.from_bytes(mapa.celdas, "little")
+    marcadas = int.from_bytes(mascara, "little")
+    # Cada byte de la máscara es 0 o 1, así que * 0xFF y * código no se mezclan entre bytes
+    celdas = (celdas & ~(marcadas * 0xFF)) | (marcadas * ord(tipo))
+    mapa.celdas[:] = celdas.to_bytes(len(mapa.celdas), "little")
+    mapa.actualizar_pasos()
+
+
+def agregar_muros_equilibrados(mapa, zona, camino_garantizado, rng=random):
+    """Agrega muros en patrón equilibrado para crear el laberinto"""
+    # Calcular celdas interiores (sin contar bordes)
+    celdas_interiores = (mapa.filas - 2) * (mapa.columnas - 2)
+    num_muros_objetivo = int(celdas_interiores * rng.uniform(*PROPORCION_MUROS))
+
+    candidatas = zona.count(1)
+    if candidatas == 0:
+        return
+
+    # Muros sueltos; los grupos agregan en promedio ~0.5 muros por cada uno
+    probabilidad = min(0.5, num_muros_objetivo / (candidatas * (1 + PROBABILIDAD_GRUPO * 1.5)))
+    muros = y(zona, mascara_aleatoria(rng, len(zona), probabilidad))
+
+    # Ocasionalmente crear grupos pequeños (2-4 muros juntos) alrededor de algunos muros
+    grupos = y(muros, mascara_aleatoria(rng, len(zona), PROBABILIDAD_GRUPO))
+    vecinos = bytes(len(zona))
+    for pasos in (1, -1, mapa.ancho, -mapa.ancho):
+        elegidos = y(desplazar(grupos, pasos), mascara_aleatoria(rng, len(zona), PROBABILIDAD_VECINO_GRUPO))
+        vecinos = o(vecinos, elegidos)
+
+    # Los vecinos de un grupo pueden quedar a 1 casilla del marco, pero nunca en el camino
+    permitidas = mascara_interior(mapa, 1)
+    for fila, col in camino_garantizado:
+        permitidas[mapa.indice(fila, col)] = 0
+
+    poner_tipo(mapa, o(muros, y(vecinos, permitidas)), "W")
+
+
+def agregar_elementos_tacticos(mapa, zona, rng=random):
+    """Agrega lianas y túneles distribuidos estratégicamente por el mapa"""
+    # Calcular basado en celdas de camino disponibles (solo el interior tiene caminos)
+    celdas_camino = mapa.celdas.count(b"P")
+
+    num_lianas = int(celdas_camino * rng.uniform(*PROPORCION_LIANAS))
+    num_tuneles = int(celdas_camino * rng.uniform(*PROPORCION_TUNELES))
+
+    # Agregar lianas y luego túneles, solo sobre caminos de la zona permitida
+    for tipo, cantidad in (("L", num_lianas), ("T", num_tuneles)):
+        candidatas = y(zona, mascara_de_tipo(mapa, "P"))
+        disponibles = candidatas.count(1)
+        if disponibles == 0:
+            continue
+
+        elegidas = y(candidatas, mascara_aleatoria(rng, len(candidatas), cantidad / disponibles))
+        poner_tipo(mapa, elegidas, tipo)
+
+
+def region_enemigos(mapa, modo, inicio, salida):
+    """(regiones del rol de los enemigos, región desde la que llegan a su objetivo)
+
+    En escape los enemigos son Hunters y persiguen al jugador desde el
+    inicio; en hunter son Runners y buscan la salida.
+    """
+    if modo == "escape":
+        regiones_rol = regiones(mapa, TRANSITABLES["Hunter"])
+        return regiones_rol, regiones_rol.region(*inicio)
+    regiones_rol = regiones(mapa, TRANSITABLES["Runner"])
+    return regiones_rol, regiones_rol.region(*salida)
+
+
+def es_valido(mapa, modo, inicio, salida):
+    """Si un Runner puede ir del inicio a la salida y hay lugar para los enemigos"""
+    if not regiones(mapa, TRANSITABLES["Runner"]).conectadas(inicio, salida):
+        return False
+
+    # Los enemigos aparecen en su región: tiene que ser la más grande de su rol
+    regiones_rol, region = region_enemigos(mapa, modo, inicio, salida)
+    tamaño = regiones_rol.tamaños[region]
+    return tamaño >= MIN_REGION_ENEMIGOS and tamaño == max(regiones_rol.tamaños)
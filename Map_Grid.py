@@ -0,0 +1,182 @@
+'''Mapa compacto: una casilla = un byte
+
+Las casillas se guardan en un bytearray con un borde extra de muros
+("W") alrededor del mapa, así los vecinos de cualquier casilla del mapa
+siempre existen y no hace falta revisar los límites. Junto a las casillas
+se guarda otro bytearray con los bits de qué roles pueden pisar cada una.
+'''
+
+# Bits de paso por rol
+BIT_HUNTER = 1
+BIT_RUNNER = 2
+
+MASCARAS = {
+    "Hunter": BIT_HUNTER,
+    "Runner": BIT_RUNNER,
+}
+
+# Qué roles pueden pisar cada tipo de casilla
+PASO_POR_TIPO = {
+    "W": 0,
+    "P": BIT_HUNTER | BIT_RUNNER,
+    "L": BIT_HUNTER,
+    "T": BIT_RUNNER,
+    "E": BIT_RUNNER,
+}
+
+BORDE = ord("W")
+
+
+def crear_tabla(valores):
+    """Tabla de 256 bytes para bytes.translate: código de casilla -> valor"""
+    tabla = bytearray(256)
+    for tipo, valor in valores.items():
+        tabla[ord(tipo)] = valor
+    return bytes(tabla)
+
+
+TABLA_PASO = crear_tabla(PASO_POR_TIPO)
+
+
+class FilaGrid:
+    """Vista de una fila para poder seguir usando mapa[fila][col]"""
+
+    def __init__(self, grid, fila):
+        self.grid = grid
+        self.inicio = grid.indice(fila, 0)
+
+    def __len__(self):
+        return self.grid.columnas
+
+    def __getitem__(self, col):
+        if not 0 <= col < self.grid.columnas:
+            raise IndexError(col)
+        return chr(self.grid.celdas[self.inicio + col])
+
+    def __setitem__(self, col, tipo):
+        if not 0 <= col < self.grid.columnas:
+            raise IndexError(col)
+        self.grid.poner_indice(self.inicio + col, tipo)
+
+    def __iter__(self):
+        for codigo in self.grid.celdas[self.inicio:self.inicio + self.grid.columnas]:
+            yield chr(codigo)
+
+
+class Grid:
+    def __init__(self, filas, columnas, relleno="P"):
+        self.filas = filas
+        self.columnas = columnas
+        # Ancho real de cada fila guardada (con el borde a cada lado)
+        self.ancho = columnas + 2
+        # Regiones conectadas ya calculadas (Map_Regions), por tipos transitables
+        self.regiones = {}
+        # Funciones observador(fila, col) a las que se avisa cuando cambia una casilla
+        self.observadores = []
+        # Aumenta con cada cambio de casillas (para saber si algo calculado sigue valiendo)
+        self.version = 0
+
+        self.celdas = bytearray([BORDE]) * ((filas + 2) * self.ancho)
+        for fila in range(filas):
+            inicio = self.indice(fila, 0)
+            self.celdas[inicio:inicio + columnas] = relleno.encode() * columnas
+        self.actualizar_pasos()
+
+    @classmethod
+    def desde_filas(cls, filas):
+        """Crea el mapa compacto a partir de una lista de listas de letras"""
+        grid = cls(len(filas), len(filas[0]))
+        for fila, casillas in enumerate(filas):
+            inicio = grid.indice(fila, 0)
+            grid.celdas[inicio:inicio + grid.columnas] = "".join(casillas).encode()
+        grid.actualizar_pasos()
+        return grid
+
+    def indice(self, fila, col):
+        return (fila + 1) * self.ancho + col + 1
+
+    def __len__(self):
+        return self.filas
+
+    def __getitem__(self, fila):
+        if not 0 <= fila < self.filas:
+            raise IndexError(fila)
+        return FilaGrid(self, fila)
+
+    def __iter__(self):
+        for fila in range(self.filas):
+            yield FilaGrid(self, fila)
+
+    def casilla(self, fila, col):
+        return chr(self.celdas[self.indice(fila, col)])
+
+    def poner(self, fila, col, tipo):
+        self.poner_indice(self.indice(fila, col), tipo)
+
+    def poner_indice(self, indice, tipo):
+        codigo = ord(tipo)
+        self.celdas[indice] = codigo
+        self.pasos[indice] = TABLA_PASO[codigo]
+        self.regiones.clear()
+        self.version += 1
+
+        if self.observadores:
+            fila, col = divmod(indice, self.ancho)
+            self.avisar(fila - 1, col - 1)
+
+    def actualizar_pasos(self):
+        """Recalcula los bits de paso después de cambiar muchas casillas de una vez"""
+        self.pasos = bytearray(self.celdas.translate(TABLA_PASO))
+        self.regiones.clear()
+        self.version += 1
+        self.avisar(None, None)
+
+    def escuchar(self, observador):
+        """Registra observador(fila, col); (None, None) significa que pudo cambiar todo el mapa"""
+        if observador not in self.observadores:
+            self.observadores.append(observador)
+
+    def dejar_de_escuchar(self, observador):
+        if observador in self.observadores:
+            self.observadores.remove(observador)
+
+    def avisar(self, fila, col):
+        for observador in self.observadores:
+            observador(fila, col)
+
+    def es_transitable(self, fila, col, mascara):
+        """Si algún rol de 'mascara' puede pisar la casilla
+
+        Las casillas a una de distancia del mapa son el borde de muros, así
+        que los vecinos de cualquier casilla se pueden consultar sin más.
+        """
+        return self.pasos[(fila + 1) * self.ancho + col + 1] & mascara != 0
+
+    def mascara_transitable(self, tipos):
+        """bytearray (con el mismo borde e índices) con 1 donde la casilla es de 'tipos'"""
+        return bytearray(self.celdas.translate(crear_tabla({tipo: 1 for tipo in tipos})))
+
+    def copia(self):
+        nuevo = Grid.__new__(Grid)
+        nuevo.filas = self.filas
+        nuevo.columnas = self.columnas
+        nuevo.ancho = self.ancho
+        nuevo.celdas = bytearray(self.celdas)
+        nuevo.pasos = bytearray(self.pasos)
+        # Las regiones no guardan referencias al mapa, así que sirven para la copia
+        nuevo.regiones = dict(self.regiones)
+        # Quien escucha al original no dibuja la copia
+        nuevo.observadores = []
+        nuevo.version = self.version
+        return nuevo
+
+    def a_filas(self):
+        """El mapa como lista de listas de letras"""
+        return [list(fila) for fila in self]
+
+
+def como_grid(mapa):
+    """El mismo mapa si ya es compacto; si es una lista de listas, una copia compacta"""
+    if isinstance(mapa, Grid):
+        return mapa
+    return Grid.desde_filas(mapa)
@@ -0,0 +1,114 @@
+import pygame
+from collections import OrderedDict
+
+from Map_Grid import Grid
+import Display_Format
+
+# Colores de las casillas
+COLOR_CAMINO = (200, 200, 200, 100)
+COLOR_BORDE = (0, 0, 0)
+
+# Casillas por lado de cada trozo pre-renderizado
+TAMAÑO_CHUNK = 16
+# Trozos guardados a la vez (una vista de 800x600 usa a lo sumo 9)
+MAX_CHUNKS = 32
+
+
+class MapLayer:
+    """Capa del laberinto pre-renderizada por trozos (chunks)
+
+    Cada trozo de TAMAÑO_CHUNK x TAMAÑO_CHUNK casillas se construye la
+    primera vez que entra en pantalla y se guarda en un LRU acotado, así un
+    mapa enorme no ocupa memoria por las partes que nunca se ven.
+
+    La capa escucha los cambios del mapa (Map_Grid): cambiar una casilla
+    descarta solo el trozo que la contiene, que se vuelve a construir la
+    próxima vez que se vea.
+    """
+
+    def __init__(self, sprites, tile_size, tamaño_chunk=TAMAÑO_CHUNK):
+        self.sprites = sprites
+        self.tile_size = tile_size
+        self.tamaño_chunk = tamaño_chunk
+        # (fila_chunk, col_chunk) -> superficie
+        self.chunks = OrderedDict()
+        self.mapa = None
+
+    def invalidar(self):
+        """Fuerza a reconstruir la capa en el próximo dibujado"""
+        self.usar_mapa(None)
+
+    def usar_mapa(self, mapa):
+        """Cambia el mapa que se dibuja y se suscribe a sus cambios de casillas"""
+        if isinstance(self.mapa, Grid):
+            self.mapa.dejar_de_escuchar(self.casilla_cambiada)
+
+        self.chunks.clear()
+        self.mapa = mapa
+
+        if isinstance(mapa, Grid):
+            mapa.escuchar(self.casilla_cambiada)
+
+    def casilla_cambiada(self, fila, col):
+        """Descarta el trozo de la casilla (o todos si cambió todo el mapa)"""
+        if fila is None:
+            self.chunks.clear()
+        else:
+            self.chunks.pop((fila // self.tamaño_chunk, col // self.tamaño_chunk), None)
+
+    def construir_chunk(self, mapa, fila_chunk, col_chunk):
+        tile = self.tile_size
+        fila_inicio = fila_chunk * self.tamaño_chunk
+        col_inicio = col_chunk * self.tamaño_chunk
+        fila_fin = min(len(mapa), fila_inicio + self.tamaño_chunk)
+        col_fin = min(len(mapa[0]), col_inicio + self.tamaño_chunk)
+
+        superficie = pygame.Surface(((col_fin - col_inicio) * tile, (fila_fin - fila_inicio) * tile),
+                                    pygame.SRCALPHA)
+
+        for fila in range(fila_inicio, fila_fin):
+            for col in range(col_inicio, col_fin):
+                tipo = mapa[fila][col]
+                x = (col - col_inicio) * tile
+                y = (fila - fila_inicio) * tile
+
+                if tipo == "P":
+                    # Camino - semi-transparente para ver el fondo
+                    superficie.fill(COLOR_CAMINO, (x, y, tile, tile))
+                elif tipo in self.sprites:
+                    # Usar sprites para W, L, T, E
+                    superficie.blit(self.sprites[tipo], (x, y))
+
+                # Borde para todas las casillas
+                pygame.draw.rect(superficie, COLOR_BORDE, (x, y, tile, tile), 1)
+
+        # Los caminos son semi-transparentes: el trozo necesita alpha
+        return Display_Format.convertir(superficie, alpha=True)
+
+    def obtener_chunk(self, mapa, fila_chunk, col_chunk):
+        clave = (fila_chunk, col_chunk)
+        superficie = self.chunks.get(clave)
+        if superficie is None:
+            superficie = self.construir_chunk(mapa, fila_chunk, col_chunk)
+            self.chunks[clave] = superficie
+            while len(self.chunks) > MAX_CHUNKS:
+                self.chunks.popitem(last=False)
+        else:
+            self.chunks.move_to_end(clave)
+        return superficie
+
+    def dibujar(self, ventana, mapa, camara):
+        """Dibuja solo los trozos que la cámara tiene en pantalla"""
+        if mapa is not self.mapa:
+            self.usar_mapa(mapa)
+
+        margen_x, margen_y = camara.desplazamiento()
+        fila_inicio, fila_fin, col_inicio, col_fin = camara.rango_visible()
+        if fila_inicio >= fila_fin or col_inicio >= col_fin:
+            return
+
+        lado = self.tamaño_chunk * self.tile_size
+        for fila_chunk in range(fila_inicio // self.tamaño_chunk, (fila_fin - 1) // self.tamaño_chunk + 1):
+            for col_chunk in range(col_inicio // self.tamaño_chunk, (col_fin - 1) // self.tamaño_chunk + 1):
+                superficie = self.obtener_chunk(mapa, fila_chunk, col_chunk)
+                ventana.blit(superficie, (margen_x + col_chunk * lado, margen_y + fila_chunk * lado))
@@ -0,0 +1,132 @@
+import random
+import threading
+from collections import OrderedDict, deque
+
+import Map_Generator
+
+# Semillas que se prueban en el hilo principal antes de rendirse
+MAX_SEMILLAS = 5
+
+
+class MapPool:
+    """Mapas pre-generados en segundo plano, guardados por semilla
+
+    - Los mapas se guardan en un LRU acotado con clave (modo, semilla, filas, columnas).
+    - Un hilo trabajador mantiene algunas semillas listas por modo para que
+      una partida sin semilla empiece sin esperar a la generación.
+    - Pedir una semilla concreta siempre reproduce el mismo mapa.
+    """
+
+    def __init__(self, capacidad=32, reserva=3):
+        self.capacidad = capacidad
+        self.reserva = reserva
+
+        self.mapas = OrderedDict()
+        # (modo, filas, columnas) -> semillas ya generadas y sin usar
+        self.listos = {}
+        # Pedidos pendientes para el hilo trabajador
+        self.pedidos = deque()
+
+        self.lock = threading.Lock()
+        self.hay_pedidos = threading.Condition(self.lock)
+        self.hilo = None
+
+    def obtener(self, modo, semilla=None, filas=Map_Generator.MAP_ROWS, columnas=Map_Generator.MAP_COLS):
+        """Retorna (semilla, mapa, inicio, salida); el mapa es una copia que se puede modificar
+
+        Si la semilla no produce un mapa válido se usa otra, y la semilla
+        retornada es la del mapa que se entregó.
+        """
+        grupo = (modo, filas, columnas)
+        # Solo las partidas sin semilla consumen (y reponen) la reserva
+        usa_reserva = semilla is None
+
+        with self.lock:
+            if usa_reserva and self.listos.get(grupo):
+                semilla = self.listos[grupo].popleft()
+            clave = (modo, semilla, filas, columnas)
+            generado = self.mapas.get(clave) if semilla is not None else None
+            if generado is not None:
+                self.mapas.move_to_end(clave)
+
+        if semilla is None:
+            semilla = nueva_semilla()
+
+        if generado is None:
+            semilla, generado = generar_con_reintentos(modo, semilla, filas, columnas)
+            self.guardar((modo, semilla, filas, columnas), generado)
+
+        # Reponer la reserva para la próxima partida
+        if usa_reserva:
+            self.precargar(modo, filas, columnas)
+
+        mapa, inicio, salida = generado
+        return semilla, mapa.copia(), inicio, salida
+
+    def precargar(self, modo, filas=Map_Generator.MAP_ROWS, columnas=Map_Generator.MAP_COLS):
+        """Pide al hilo trabajador que deje 'reserva' mapas listos para este modo"""
+        grupo = (modo, filas, columnas)
+
+        with self.lock:
+            pendientes = len(self.listos.get(grupo, ())) + self.pedidos.count(grupo)
+            for _ in range(self.reserva - pendientes):
+                self.pedidos.append(grupo)
+            self.hay_pedidos.notify()
+
+            if self.hilo is None:
+                self.hilo = threading.Thread(target=self.trabajar, daemon=True)
+                self.hilo.start()
+
+    def guardar(self, clave, generado):
+        with self.lock:
+            self.mapas[clave] = generado
+            self.mapas.move_to_end(clave)
+            while len(self.mapas) > self.capacidad:
+                self.mapas.popitem(last=False)
+
+    def trabajar(self):
+        while True:
+            with self.lock:
+                while not self.pedidos:
+                    self.hay_pedidos.wait()
+                grupo = self.pedidos.popleft()
+
+            modo, filas, columnas = grupo
+            semilla = nueva_semilla()
+            try:
+                generado = generar(modo, semilla, filas, columnas)
+            except Exception as e:
+                # Si el hilo muriera, nadie atendería los pedidos siguientes
+                print(f"Error al pre-generar un mapa: {e}")
+                continue
+            self.guardar((modo, semilla, filas, columnas), generado)
+
+            with self.lock:
+                self.listos.setdefault(grupo, deque()).append(semilla)
+
+
+def nueva_semilla():
+    return random.randrange(2 ** 32)
+
+
+def generar(modo, semilla, filas, columnas):
+    return Map_Generator.generar_mapa(modo, filas, columnas, random.Random(semilla))
+
+
+def generar_con_reintentos(modo, semilla, filas, columnas):
+    """Como generar(), pero si la semilla no da un mapa válido prueba con otras
+
+    Retorna (semilla, generado). generar_mapa() lanza RuntimeError tras
+    MAX_INTENTOS mapas inválidos; en el hilo principal eso cerraría el juego.
+    """
+    for _ in range(MAX_SEMILLAS - 1):
+        try:
+            return semilla, generar(modo, semilla, filas, columnas)
+        except RuntimeError as e:
+            print(f"Error al generar el mapa con la semilla {semilla}: {e}")
+            semilla = nueva_semilla()
+    return semilla, generar(modo, semilla, filas, columnas)
+
+
+# Pool compartido por todo el juego
+pool = MapPool()
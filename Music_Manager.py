@@ -1,29 +1,42 @@
-import pygame
-import json
+import io
 import os
+import pygame
+import Settings_Manager
 
 musica_actual = None
 efectos_cargados = {}
 
-def cargar_configuracion(config_path="settings.json"):
-    """Carga la configuración de audio desde settings.json"""
-    if os.path.exists(config_path):
-        with open(config_path, "r") as f:
-            return json.load(f)
-    return {
-        "musica_activada": True,
-        "efectos_activados": True,
-        "volumen_musica": 5,
-        "volumen_efectos": 5
-    }
+# ruta -> bytes de los archivos de audio que la precarga ya leyó del disco
+archivos_leidos = {}
+# pygame lee la música mientras suena: el archivo en memoria tiene que seguir vivo
+pista_en_memoria = None
+
+def agregar_archivo(ruta, datos):
+    """Guarda un archivo de audio leído por la precarga (None si no se pudo leer)"""
+    if datos is not None:
+        archivos_leidos[ruta] = datos
+
+def cargar_pista(ruta):
+    """pygame.mixer.music.load() desde memoria si la precarga ya leyó el archivo"""
+    global pista_en_memoria
+    datos = archivos_leidos.get(ruta)
+    if datos is None:
+        pygame.mixer.music.load(ruta)
+        return
+    pista_en_memoria = io.BytesIO(datos)
+    pygame.mixer.music.load(pista_en_memoria, os.path.splitext(ruta)[1][1:])
+
+def cargar_configuracion():
+    """Configuración de audio en memoria (settings.json se lee una sola vez)"""
+    return Settings_Manager.obtener()
 
-def reproducir_musica(ruta, volumen_config_path="settings.json"):
+def reproducir_musica(ruta):
     global musica_actual
     if musica_actual == ruta:
         return
 
-    # Leer configuración
-    settings = cargar_configuracion(volumen_config_path)
+    # Leer configuración (se relee solo si settings.json cambió en el disco)
+    settings = Settings_Manager.refrescar()
     
     # Verificar si la música está activada
     if not settings.get("musica_activada", True):
@@ -33,7 +46,7 @@ def reproducir_musica(ruta, volumen_config_path="settings.json"):
 
     # Cargar y reproducir música
     try:
-        pygame.mixer.music.load(ruta)
+        cargar_pista(ruta)
         pygame.mixer.music.set_volume(volumen)
         pygame.mixer.music.play(-1)
         musica_actual = ruta
@@ -54,11 +67,9 @@ def reanudar_musica():
     """Reanuda la música pausada"""
     pygame.mixer.music.unpause()
 
-def reproducir_efecto(nombre_efecto, config_path="settings.json"):
-    global efectos_cargados
-    
-    # Leer configuración
-    settings = cargar_configuracion(config_path)
+def reproducir_efecto(nombre_efecto):
+    # Leer configuración desde memoria (se llama dentro del bucle de juego)
+    settings = cargar_configuracion()
     
     # Verificar si los efectos están activados
     if not settings.get("efectos_activados", True):
@@ -67,24 +78,34 @@ def reproducir_efecto(nombre_efecto, config_path="settings.json"):
     volumen = settings.get("volumen_efectos", 5) / 10
     
     # Cargar efecto si no está en cache
+    efecto = cargar_efecto(nombre_efecto)
+    if efecto is None:
+        return
+    
+    # Reproducir efecto
+    efecto.set_volume(volumen)
+    efecto.play()
+
+def ruta_efecto(nombre_efecto):
+    return f"ASSETS/SOUND EFFECTS/{nombre_efecto}.mp3"
+
+def cargar_efecto(nombre_efecto):
+    """El efecto desde la caché (se decodifica solo la primera vez), o None si no se pudo cargar"""
     if nombre_efecto not in efectos_cargados:
-        ruta = f"ASSETS/SOUND EFFECTS/{nombre_efecto}.mp3"
+        ruta = ruta_efecto(nombre_efecto)
+        datos = archivos_leidos.get(ruta)
         try:
-            efecto = pygame.mixer.Sound(ruta)
+            efecto = pygame.mixer.Sound(ruta if datos is None else io.BytesIO(datos))
             efectos_cargados[nombre_efecto] = efecto
         except pygame.error as e:
             print(f"No se pudo cargar el efecto {nombre_efecto}: {e}")
-            return
-    
-    # Reproducir efecto
-    efecto = efectos_cargados[nombre_efecto]
-    efecto.set_volume(volumen)
-    efecto.play()
+            return None
+    return efectos_cargados[nombre_efecto]
 
-def actualizar_volumen_musica(config_path="settings.json"):
+def actualizar_volumen_musica():
     """Actualiza el volumen de la música actual según la configuración"""
     if pygame.mixer.music.get_busy():
-        settings = cargar_configuracion(config_path)
+        settings = cargar_configuracion()
         if settings.get("musica_activada", True):
             volumen = settings.get("volumen_musica", 5) / 10
             pygame.mixer.music.set_volume(volumen)
@@ -0,0 +1,36 @@
+class OccupancyGrid:
+    """Qué entidades (jugador, enemigos, trampas) hay en cada casilla
+
+    Las entidades se registran con set_ocupacion() y avisan al moverse, así
+    que saber quién está en una casilla es una búsqueda en un diccionario en
+    lugar de recorrer todas las listas.
+    """
+
+    def __init__(self):
+        # (fila, col) -> [entidad, ...] en orden de llegada
+        self.celdas = {}
+
+    def agregar(self, entidad, pos):
+        self.celdas.setdefault(pos, []).append(entidad)
+
+    def quitar(self, entidad, pos):
+        entidades = self.celdas.get(pos)
+        if entidades and entidad in entidades:
+            entidades.remove(entidad)
+            if not entidades:
+                del self.celdas[pos]
+
+    def mover(self, entidad, anterior, nueva):
+        if anterior != nueva:
+            self.quitar(entidad, anterior)
+            self.agregar(entidad, nueva)
+
+    def en(self, pos, tipo=None):
+        """Entidades en la casilla (solo las de la clase 'tipo' si se indica)"""
+        entidades = self.celdas.get(pos, ())
+        if tipo is None:
+            return list(entidades)
+        return [entidad for entidad in entidades if isinstance(entidad, tipo)]
+
+    def hay(self, pos, tipo=None):
+        return bool(self.en(pos, tipo))
@@ -0,0 +1,560 @@
+import heapq
+from collections import deque
+
+from Map_Grid import como_grid
+from Map_Regions import regiones
+
+# Direcciones de movimiento (mismo orden que usa la IA de los enemigos)
+DIRECCIONES = [(-1, 0), (1, 0), (0, -1), (0, 1)]
+
+# Casillas transitables según el rol
+TRANSITABLES = {
+    "Hunter": ("P", "L"),
+    "Runner": ("P", "T", "E"),
+}
+
+INFINITO = float("inf")
+
+# Casillas que avanza cada recorrido de DistanceField.mover_origen antes de ceder el turno al otro
+TANDA_RECORRIDO = 64
+
+
+class DistanceField:
+    """Campo de distancias (BFS inverso) compartido por varios enemigos
+
+    El cálculo es perezoso: actualizar() solo anota el nuevo origen y el
+    campo se pone al día la primera vez que alguien lo consulta, así los
+    ticks en los que ningún enemigo se mueve no pagan nada.
+
+    Cuando el origen avanza una casilla (el caso normal: el jugador camina)
+    no se rehace el BFS. En una grilla, al mover el origen a una vecina
+    todas las distancias cambian en exactamente ±1: bajan en 1 las casillas
+    a las que algún camino más corto desde el origen anterior pasaba por el
+    nuevo, y suben en 1 todas las demás. Las distancias se guardan relativas
+    a 'base' (distancia real = distancias[i] + base): se suma 1 a 'base' y
+    solo se recorren y corrigen las casillas que bajan. El BFS completo
+    queda para el primer cálculo, los saltos de más de una casilla y los
+    cambios del mapa.
+    """
+
+    def __init__(self, transitables):
+        self.transitables = transitables
+        self.origen = None
+        self.mapa = None
+        self.version = None
+        # Distancias en un arreglo plano con los mismos índices que Map_Grid,
+        # relativas a 'base'
+        self.distancias = []
+        self.base = 0
+        self.libre = bytearray()
+        self.indice_origen = 0
+        self.ancho = 0
+        self.pendiente = False
+        # Orígenes (de a una casilla) que faltan aplicar al campo ya calculado
+        self.pasos = []
+        # Casillas corregidas en la última actualización (BFS completo = todas)
+        self.casillas_revisadas = 0
+
+    def actualizar(self, origen, mapa):
+        """Anota el nuevo origen; el campo se pone al día en la próxima consulta"""
+        version = getattr(mapa, "version", None)
+        if origen == self.origen and mapa is self.mapa and version == self.version:
+            return
+
+        if (self.pendiente or mapa is not self.mapa or version != self.version or
+                self.origen is None or
+                abs(origen[0] - self.origen[0]) + abs(origen[1] - self.origen[1]) != 1):
+            # Primer cálculo, otro mapa o un salto: BFS completo
+            self.pendiente = True
+            self.pasos = []
+        else:
+            self.pasos.append(origen)
+
+        self.origen = origen
+        self.mapa = mapa
+        self.version = version
+
+    def obtener_distancias(self):
+        if not self.pendiente and self.pasos:
+            anterior = None
+            for origen in self.pasos:
+                if not self.mover_origen(anterior, origen):
+                    self.pendiente = True
+                    break
+                anterior = origen
+            self.pasos = []
+
+        if self.pendiente:
+            self.distancias = self.calcular(self.origen, self.mapa)
+            self.pendiente = False
+            self.pasos = []
+        return self.distancias
+
+    def mover_origen(self, anterior, nuevo):
+        """Lleva el campo de un origen a su vecino 'nuevo'; False si hace falta el BFS completo
+
+        'anterior' es el origen actual del campo (None = el del último cálculo).
+        """
+        distancias = self.distancias
+        base = self.base
+        inicio = self.indice_origen if anterior is None else self.indice(anterior)
+        destino = self.indice(nuevo)
+        if not (self.libre[inicio] and self.libre[destino]):
+            return False
+
+        # Se recorren a la par las casillas que bajan y las que suben y se
+        # corrige el grupo que termina primero: el costo es el del más chico
+        bajan = self.casillas_que_bajan(destino)
+        suben = self.casillas_que_suben(inicio, destino)
+        while True:
+            try:
+                next(bajan)
+            except StopIteration as fin:
+                # Las demás suben 1 (a través de 'base'); las que bajan, 1 en total
+                corregidas = fin.value
+                self.base = base + 1
+                for indice in corregidas:
+                    distancias[indice] -= 2
+                break
+            try:
+                next(suben)
+            except StopIteration as fin:
+                corregidas = fin.value
+                self.base = base - 1
+                for indice in corregidas:
+                    distancias[indice] += 2
+                break
+
+        self.indice_origen = destino
+        self.casillas_revisadas = len(corregidas)
+        return True
+
+    def casillas_que_bajan(self, destino):
+        """El nuevo origen y lo que cuelga de él en los caminos más cortos desde el anterior
+
+        Generador: avanza de a TANDA_RECORRIDO casillas y al terminar retorna la lista.
+        """
+        distancias = self.distancias
+        desplazamientos = (-self.ancho, self.ancho, -1, 1)
+        bajan = [destino]
+        marcadas = {destino}
+        for numero, actual in enumerate(bajan):
+            if numero % TANDA_RECORRIDO == 0:
+                yield
+            siguiente = distancias[actual] + 1
+            for desplazamiento in desplazamientos:
+                vecino = actual + desplazamiento
+                if distancias[vecino] == siguiente and vecino not in marcadas:
+                    marcadas.add(vecino)
+                    bajan.append(vecino)
+        return bajan
+
+    def casillas_que_suben(self, inicio, destino):
+        """El origen anterior y las casillas cuyos caminos más cortos no pasan por el nuevo
+
+        Se recorre por niveles desde el origen anterior: una casilla sube si
+        todas sus vecinas un paso más cerca del origen también suben (al
+        revisar un nivel, el anterior ya está completo). Generador, como
+        casillas_que_bajan().
+        """
+        distancias = self.distancias
+        desplazamientos = (-self.ancho, self.ancho, -1, 1)
+        suben = [inicio]
+        marcadas = {inicio}
+        for numero, actual in enumerate(suben):
+            if numero % TANDA_RECORRIDO == 0:
+                yield
+            nivel = distancias[actual]
+            for desplazamiento in desplazamientos:
+                vecino = actual + desplazamiento
+                if vecino == destino or vecino in marcadas or distancias[vecino] != nivel + 1:
+                    continue
+                for otro in desplazamientos:
+                    previa = vecino + otro
+                    if distancias[previa] == nivel and previa not in marcadas:
+                        break
+                else:
+                    marcadas.add(vecino)
+                    suben.append(vecino)
+        return suben
+
+    def indice(self, casilla):
+        return (casilla[0] + 1) * self.ancho + casilla[1] + 1
+
+    def calcular(self, origen, mapa):
+        grid = como_grid(mapa)
+        libre = grid.mascara_transitable(self.transitables)
+        ancho = grid.ancho
+        self.ancho = ancho
+        self.libre = libre
+        self.base = 0
+        distancias = [INFINITO] * len(libre)
+        self.casillas_revisadas = len(libre)
+
+        # Si el origen no es transitable para este rol nadie puede llegar
+        inicio = grid.indice(*origen)
+        self.indice_origen = inicio
+        if not libre[inicio]:
+            return distancias
+
+        distancias[inicio] = 0
+        cola = deque([inicio])
+        # Mismo orden que DIRECCIONES; el borde de muros evita revisar límites
+        desplazamientos = (-ancho, ancho, -1, 1)
+
+        while cola:
+            actual = cola.popleft()
+            siguiente = distancias[actual] + 1
+
+            for desplazamiento in desplazamientos:
+                vecino = actual + desplazamiento
+                if libre[vecino] and distancias[vecino] == INFINITO:
+                    distancias[vecino] = siguiente
+                    cola.append(vecino)
+
+        return distancias
+
+    def distancia(self, fila, col):
+        """Distancia al origen (la casilla puede ser vecina del mapa, pero no más lejos)"""
+        distancias = self.obtener_distancias()
+        if not distancias:
+            return INFINITO
+        return distancias[(fila + 1) * self.ancho + col + 1] + self.base
+
+    def siguiente_paso(self, fila, col):
+        """Devuelve la casilla vecina más cercana al origen, o None si no hay camino"""
+        distancias = self.obtener_distancias()
+        if not distancias:
+            return None
+        indice = (fila + 1) * self.ancho + col + 1
+        mejor = None
+        mejor_distancia = INFINITO
+
+        for df, dc in DIRECCIONES:
+            distancia = distancias[indice + df * self.ancho + dc]
+            if distancia < mejor_distancia:
+                mejor_distancia = distancia
+                mejor = (fila + df, col + dc)
+
+        return mejor
+
+
+# Mapa de huida: costo extra por pisar casillas cerca del perseguidor
+RADIO_HUIDA = 6
+FACTOR_HUIDA = 4
+
+
+class FleeMap:
+    """Mapa de huida ("Dijkstra map") compartido por todos los Runners
+
+    Combina dos campos de distancias: el camino hacia la salida y la
+    distancia al perseguidor. Cada paso cuesta 1 más una penalización por
+    entrar en casillas cerca del perseguidor (hasta RADIO_HUIDA casillas),
+    así que bajar por el mapa lleva a la salida rodeando al perseguidor en
+    lugar de acercarse a él. La casilla del perseguidor y sus 4 vecinas no
+    se pueden cruzar: si la única salida pasa por él, no hay camino (y el
+    Runner huye directamente). Se recalcula solo cuando el perseguidor se
+    mueve (y solo si algún Runner lo consulta), con un costo fijo de
+    O(mapa) por tick.
+    """
+
+    def __init__(self, transitables, transitables_perseguidor,
+                 radio=RADIO_HUIDA, factor=FACTOR_HUIDA):
+        self.transitables = transitables
+        self.radio = radio
+        self.factor = factor
+
+        # Hasta dónde puede llegar el perseguidor (y en cuántos pasos)
+        self.campo_perseguidor = DistanceField(transitables_perseguidor)
+
+        self.perseguidor = None
+        self.salida = None
+        self.mapa = None
+        # Valores en un arreglo plano con los mismos índices que Map_Grid
+        self.valores = []
+        self.ancho = 0
+        self.pendiente = False
+
+    def actualizar(self, perseguidor, salida, mapa):
+        """Marca el mapa para recalcular solo si el perseguidor, la salida o el mapa cambiaron"""
+        if perseguidor == self.perseguidor and salida == self.salida and mapa is self.mapa:
+            return
+
+        self.perseguidor = perseguidor
+        self.salida = salida
+        self.mapa = mapa
+        self.campo_perseguidor.actualizar(perseguidor, mapa)
+        self.pendiente = True
+
+    def obtener_valores(self):
+        if self.pendiente:
+            self.valores = self.calcular(self.salida, self.mapa)
+            self.pendiente = False
+        return self.valores
+
+    def peligro(self, distancia):
+        """Penalización por entrar en una casilla a 'distancia' del perseguidor"""
+        return self.factor * (self.radio - min(distancia, self.radio))
+
+    def calcular(self, salida, mapa):
+        grid = como_grid(mapa)
+        libre = grid.mascara_transitable(self.transitables)
+        ancho = grid.ancho
+        self.ancho = ancho
+        valores = [INFINITO] * len(libre)
+
+        # El perseguidor y sus vecinas cortan el paso
+        bloqueadas = set()
+        if self.perseguidor is not None:
+            centro = grid.indice(*self.perseguidor)
+            bloqueadas = {centro, centro - ancho, centro + ancho, centro - 1, centro + 1}
+
+        meta = grid.indice(*salida)
+        if not libre[meta] or meta in bloqueadas:
+            return valores
+
+        # Distancias del perseguidor con los mismos índices
+        distancias_perseguidor = self.campo_perseguidor.obtener_distancias() or [INFINITO] * len(libre)
+        base_perseguidor = self.campo_perseguidor.base
+        desplazamientos = (-ancho, ancho, -1, 1)
+
+        # Dijkstra desde la salida: el valor es el costo de llegar a ella
+        valores[meta] = 0
+        pendientes = [(0, meta)]
+
+        while pendientes:
+            valor, actual = heapq.heappop(pendientes)
+            if valor > valores[actual]:
+                continue
+
+            # Pisar la salida es escapar, así que solo se penaliza el resto
+            costo = 1 + (self.peligro(distancias_perseguidor[actual] + base_perseguidor)
+                         if actual != meta else 0)
+
+            for desplazamiento in desplazamientos:
+                vecino = actual + desplazamiento
+                if libre[vecino] and vecino not in bloqueadas and valor + costo < valores[vecino]:
+                    valores[vecino] = valor + costo
+                    heapq.heappush(pendientes, (valor + costo, vecino))
+
+        return valores
+
+    def valor(self, fila, col):
+        valores = self.obtener_valores()
+        if not valores:
+            return INFINITO
+        return valores[(fila + 1) * self.ancho + col + 1]
+
+    def siguiente_paso(self, fila, col):
+        """Vecina con menor valor, o None si no hay camino a la salida"""
+        valores = self.obtener_valores()
+        if not valores:
+            return None
+        indice = (fila + 1) * self.ancho + col + 1
+        mejor = None
+        mejor_valor = valores[indice]
+
+        for df, dc in DIRECCIONES:
+            valor = valores[indice + df * self.ancho + dc]
+            if valor < mejor_valor:
+                mejor_valor = valor
+                mejor = (fila + df, col + dc)
+
+        return mejor
+
+
+def manhattan(fila, col, objetivo_fila, objetivo_col):
+    return abs(fila - objetivo_fila) + abs(col - objetivo_col)
+
+
+class PathPlanner:
+    """Búsqueda de caminos con JPS (jump point search) sobre la grilla de casillas
+
+    - Las casillas se guardan en arreglos planos con un borde extra de casillas
+      bloqueadas (indice = (fila + 1) * ancho + col + 1), así los vecinos son
+      indice ± 1 e indice ± ancho sin revisar los límites del mapa.
+    - Los buffers se reutilizan entre búsquedas; un número de generación marca
+      qué valores pertenecen a la búsqueda actual, así no hay que limpiarlos.
+    - Los caminos incluyen el inicio y el objetivo, igual que el BFS de Enemy.
+    - Si el inicio y el objetivo están en regiones distintas (Map_Regions) se
+      retorna None sin buscar.
+    """
+
+    def __init__(self, transitables):
+        self.transitables = transitables
+
+        self.mapa = None
+        self.filas = 0
+        self.columnas = 0
+        self.ancho = 0
+        # 1 si la casilla es transitable para este rol (el borde siempre es 0)
+        self.libre = bytearray()
+
+        # Buffers por casilla
+        self.costo = []
+        self.padre = []
+        self.vista = []
+        self.cerrada = []
+        self.generacion = 0
+
+    def preparar(self, mapa):
+        """Ajusta los buffers al mapa (solo cuando cambia de mapa)"""
+        if mapa is self.mapa:
+            return
+
+        grid = como_grid(mapa)
+        self.mapa = mapa
+        self.filas = grid.filas
+        self.columnas = grid.columnas
+        self.ancho = grid.ancho
+        self.libre = grid.mascara_transitable(self.transitables)
+        total = len(self.libre)
+
+        if len(self.costo) != total:
+            self.costo = [0] * total
+            self.padre = [-1] * total
+            self.vista = [0] * total
+            self.cerrada = [0] * total
+            self.generacion = 0
+
+    def indice(self, fila, col):
+        return (fila + 1) * self.ancho + col + 1
+
+    def casilla(self, indice):
+        fila, col = divmod(indice, self.ancho)
+        return fila - 1, col - 1
+
+    def es_libre(self, fila, col):
+        return (0 <= fila < self.filas and 0 <= col < self.columnas and
+                self.libre[self.indice(fila, col)] == 1)
+
+    def buscar(self, inicio, objetivo, mapa):
+        """Jump point search con 4 vecinos; retorna la lista de casillas o None si no hay camino"""
+        self.preparar(mapa)
+        if not self.es_libre(*inicio) or not self.es_libre(*objetivo):
+            return None
+        if not regiones(mapa, self.transitables).conectadas(inicio, objetivo):
+            return None
+
+        self.generacion += 1
+        generacion = self.generacion
+        ancho = self.ancho
+        costo, padre, vista, cerrada = self.costo, self.padre, self.vista, self.cerrada
+        # Coordenadas del objetivo en la grilla con borde (la heurística solo usa diferencias)
+        objetivo_fila, objetivo_col = objetivo[0] + 1, objetivo[1] + 1
+
+        origen = self.indice(*inicio)
+        meta = self.indice(*objetivo)
+        costo[origen] = 0
+        padre[origen] = -1
+        vista[origen] = generacion
+
+        h_origen = manhattan(inicio[0] + 1, inicio[1] + 1, objetivo_fila, objetivo_col)
+        abiertos = [(h_origen, h_origen, origen)]
+
+        while abiertos:
+            _, _, actual = heapq.heappop(abiertos)
+            if cerrada[actual] == generacion:
+                continue
+            cerrada[actual] = generacion
+
+            if actual == meta:
+                return self.reconstruir(meta)
+
+            costo_actual = costo[actual]
+            for vecino, paso in self.sucesores_jps(actual, padre[actual], meta):
+                nuevo_costo = costo_actual + paso
+                if vista[vecino] != generacion or nuevo_costo < costo[vecino]:
+                    vista[vecino] = generacion
+                    costo[vecino] = nuevo_costo
+                    padre[vecino] = actual
+                    vecino_fila, vecino_col = divmod(vecino, ancho)
+                    h_vecino = manhattan(vecino_fila, vecino_col, objetivo_fila, objetivo_col)
+                    heapq.heappush(abiertos, (nuevo_costo + h_vecino, h_vecino, vecino))
+
+        return None
+
+    def reconstruir(self, indice):
+        """Camino desde el inicio hasta 'indice', rellenando los saltos de JPS"""
+        nodos = []
+        while indice != -1:
+            nodos.append(indice)
+            indice = self.padre[indice]
+        nodos.reverse()
+
+        camino = [nodos[0]]
+        for nodo in nodos[1:]:
+            diferencia = nodo - camino[-1]
+            # Un salto es siempre en línea recta: horizontal o vertical
+            paso = self.ancho if abs(diferencia) >= self.ancho else 1
+            if diferencia < 0:
+                paso = -paso
+            while camino[-1] != nodo:
+                camino.append(camino[-1] + paso)
+        return [self.casilla(indice) for indice in camino]
+
+    # --- JPS (4 vecinos) ---
+    # Entre caminos igual de cortos se prefieren los que suben/bajan lo antes
+    # posible, así que al avanzar en horizontal solo se gira si es forzado
+    # (la casilla de atrás en esa columna está bloqueada) y al avanzar en
+    # vertical se revisan las dos horizontales en cada casilla.
+    def sucesores_jps(self, actual, padre, meta):
+        ancho = self.ancho
+        if padre == -1:
+            direcciones = (-ancho, ancho, -1, 1)
+        else:
+            diferencia = actual - padre
+            if abs(diferencia) >= ancho:
+                # Vertical: seguir y abrir las dos horizontales
+                direcciones = (ancho if diferencia > 0 else -ancho, -1, 1)
+            else:
+                # Horizontal: seguir y girar solo hacia vecinos forzados
+                paso = 1 if diferencia > 0 else -1
+                direcciones = [paso] + [giro for giro in (-ancho, ancho)
+                                        if self.forzado(actual, giro, paso)]
+
+        siguientes = []
+        for direccion in direcciones:
+            salto = self.saltar(actual, direccion, meta)
+            if salto is not None:
+                distancia = abs(salto - actual)
+                siguientes.append((salto, distancia // ancho if distancia >= ancho else distancia))
+        return siguientes
+
+    def forzado(self, indice, giro, paso):
+        """Al avanzar en horizontal, girar es forzado si la esquina de atrás está bloqueada"""
+        libre = self.libre
+        return libre[indice + giro] and not libre[indice + giro - paso]
+
+    def saltar(self, indice, direccion, meta):
+        """Avanza en línea recta hasta un punto de salto, o None si no hay ninguno"""
+        libre = self.libre
+        ancho = self.ancho
+        horizontal = abs(direccion) == 1
+
+        while True:
+            indice += direccion
+            if not libre[indice]:
+                return None
+            if indice == meta:
+                return indice
+
+            if horizontal:
+                # Vecino forzado arriba o abajo
+                if self.forzado(indice, -ancho, direccion) or self.forzado(indice, ancho, direccion):
+                    return indice
+            else:
+                # Punto de salto si alguna horizontal encuentra algo
+                if (self.saltar(indice, -1, meta) is not None or
+                        self.saltar(indice, 1, meta) is not None):
+                    return indice
+
+
+# Un planificador por rol, compartido por todos los enemigos
+planificadores = {}
+
+
+def planificador(rol):
+    if rol not in planificadores:
+        planificadores[rol] = PathPlanner(TRANSITABLES[rol])
+    return planificadores[rol]
@@ -1,5 +1,6 @@
 import pygame
 import sys
+import Text_Cache
 from Player_Name import PlayerNameScreen
 from Music_Manager import reproducir_musica
 
@@ -24,7 +25,7 @@ class Boton:
         pygame.draw.rect(ventana, NEGRO, self.rect)
         pygame.draw.rect(ventana, BLANCO, self.rect, 2)
         color_texto = VERDE_CLARO if self.hover else BLANCO
-        texto_surface = self.fuente.render(self.texto, True, color_texto)
+        texto_surface = Text_Cache.renderizar(self.fuente, self.texto, True, color_texto)
         texto_rect = texto_surface.get_rect(center=self.rect.center)
         ventana.blit(texto_surface, texto_rect)
 
@@ -65,7 +66,7 @@ class PlayScreen:
         self.ventana.fill(NEGRO)
 
         # Título centrado
-        texto_titulo = self.fuente_titulo.render("SELECCIONA EL MODO", True, BLANCO)
+        texto_titulo = Text_Cache.renderizar(self.fuente_titulo, "SELECCIONA EL MODO", True, BLANCO)
         rect_titulo = texto_titulo.get_rect(center=(ANCHO_VENTANA // 2, 120))
         self.ventana.blit(texto_titulo, rect_titulo)
 
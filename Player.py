@@ -1,6 +1,9 @@
 import pygame
 import os
 
+import Sprite_Cache
+import Map_Grid
+
 class Player:
     def __init__(self, fila_inicio, col_inicio, tile_size, modo="escape"):
         self.fila = fila_inicio
@@ -10,6 +13,8 @@ class Player:
         
         # Determinar rol según modo
         self.rol = "Runner" if modo == "escape" else "Hunter"
+        # Runner: P, T y E / Hunter: P y L (NO por túneles ni salida)
+        self.mascara_paso = Map_Grid.MASCARAS[self.rol]
         
         # Velocidad
         self.velocidad_normal = 1
@@ -40,35 +45,14 @@ class Player:
         self.en_movimiento = False
         self.llego_a_salida = False
         
+        # Grilla de ocupación (opcional)
+        self.ocupacion = None
+        
     def cargar_sprites(self):
-        """Carga todos los sprites del jugador según su rol"""
-        sprites = {}
-        direcciones = ["Up", "Down", "Left", "Right"]
-        
-        for direccion in direcciones:
-            sprites[direccion] = []
-            for num in [1, 2, 3]:
-                ruta = f"ASSETS/SPRITES/Characters/{self.rol}/{self.rol} {direccion} {num}.png"
-                try:
-                    sprite = pygame.image.load(ruta)
-                    sprite = pygame.transform.scale(sprite, (self.tile_size, self.tile_size))
-                    sprites[direccion].append(sprite)
-                except Exception as e:
-                    print(f"Error al cargar sprite: {ruta} - {e}")
-                    # Crear sprite de respaldo (círculo de color)
-                    sprite = self.crear_sprite_respaldo()
-                    sprites[direccion].append(sprite)
-        
-        return sprites
-    
-    def crear_sprite_respaldo(self):
-        """Crea un sprite de respaldo si no se pueden cargar las imágenes"""
-        superficie = pygame.Surface((self.tile_size, self.tile_size), pygame.SRCALPHA)
+        """Obtiene los sprites del jugador según su rol (compartidos desde la caché)"""
+        # Color del sprite de respaldo (círculo) si no se pueden cargar las imágenes
         color = (0, 100, 255) if self.rol == "Runner" else (255, 100, 0)
-        pygame.draw.circle(superficie, color, 
-                          (self.tile_size // 2, self.tile_size // 2), 
-                          self.tile_size // 3)
-        return superficie
+        return Sprite_Cache.cargar_sprites_personaje(self.rol, self.tile_size, color)
     
     def mover(self, teclas, mapa, energy_bar):
         # Determinar si está corriendo (Shift presionado y tiene energía)
@@ -118,11 +102,10 @@ class Player:
                 if nueva_fila != self.fila or nueva_col != self.col:
                     self.actualizar_animacion()
                     
-                self.fila = nueva_fila
-                self.col = nueva_col
+                self.mover_a(nueva_fila, nueva_col)
                 
                 # Verificar si llegó a la salida
-                if mapa[self.fila][self.col] == "E":
+                if mapa.casilla(self.fila, self.col) == "E":
                     self.llego_a_salida = True
         else:
             # Si no se mueve, volver a pose firme
@@ -130,20 +113,8 @@ class Player:
             self.indice_secuencia = 1
     
     def puede_moverse(self, fila, col, mapa):
-        # Verificar límites del mapa
-        if fila < 0 or fila >= len(mapa) or col < 0 or col >= len(mapa[0]):
-            return False
-        
-        tipo_casilla = mapa[fila][col]
-        
-        if self.modo == "escape":
-            # Jugador RUNNER: puede pasar por P, T y E
-            return tipo_casilla in ["P", "T", "E"]
-        elif self.modo == "hunter":
-            # Jugador HUNTER: puede pasar por P y L (NO por túneles ni salida)
-            return tipo_casilla in ["P", "L"]
-        
-        return False
+        # El borde de muros del mapa compacto cubre las casillas fuera de los límites
+        return mapa.es_transitable(fila, col, self.mascara_paso)
     
     def actualizar_animacion(self):
         """Actualiza el frame de animación del sprite (cambia con cada movimiento)"""
@@ -151,20 +122,50 @@ class Player:
         self.indice_secuencia = (self.indice_secuencia + 1) % len(self.secuencia_animacion)
         self.frame_actual = self.secuencia_animacion[self.indice_secuencia]
     
-    def dibujar(self, ventana, margen_x, margen_y):
-        x = margen_x + (self.col * self.tile_size)
-        y = margen_y + (self.fila * self.tile_size)
+    def guardar_posicion_anterior(self):
+        """Guarda la posición al inicio del tick para interpolar el dibujo"""
+        self.fila_anterior = self.fila
+        self.col_anterior = self.col
+    
+    def posicion_interpolada(self, alpha):
+        """Posición (fila, col) entre el tick anterior y el actual (alpha de 0 a 1)"""
+        # Solo se interpola un paso normal; reapariciones y saltos se dibujan directo
+        if abs(self.fila - self.fila_anterior) + abs(self.col - self.col_anterior) != 1:
+            return self.fila, self.col
+        
+        fila = self.fila_anterior + (self.fila - self.fila_anterior) * alpha
+        col = self.col_anterior + (self.col - self.col_anterior) * alpha
+        return fila, col
+    
+    def dibujar(self, ventana, margen_x, margen_y, alpha=1.0):
+        fila, col = self.posicion_interpolada(alpha)
+        x = margen_x + round(col * self.tile_size)
+        y = margen_y + round(fila * self.tile_size)
         
         # Obtener sprite actual
         sprite = self.sprites[self.direccion][self.frame_actual - 1]
-        ventana.blit(sprite, (x, y))
+        # Retorna la zona de la ventana que se pintó
+        return ventana.blit(sprite, (x, y))
     
     def get_posicion(self):
         """Retorna la posición actual del jugador"""
         return (self.fila, self.col)
     
-    def reset_posicion(self, fila, col):
-        """Reinicia la posición del jugador"""
+    def set_ocupacion(self, ocupacion):
+        """Registra al jugador en la grilla de ocupación (se actualiza al moverse)"""
+        self.ocupacion = ocupacion
+        ocupacion.agregar(self, (self.fila, self.col))
+    
+    def mover_a(self, fila, col):
+        """Cambia de casilla avisando a la grilla de ocupación"""
+        if self.ocupacion is not None:
+            self.ocupacion.mover(self, (self.fila, self.col), (fila, col))
         self.fila = fila
         self.col = col
+    
+    def reset_posicion(self, fila, col):
+        """Reinicia la posición del jugador"""
+        self.mover_a(fila, col)
+        self.fila_anterior = fila
+        self.col_anterior = col
         self.llego_a_salida = False
\ No newline at end of file
@@ -3,6 +3,9 @@ import sys
 from Hunter_Mode import HunterMode
 from Escape_Mode import EscapeMode
 from Music_Manager import reproducir_musica, detener_musica
+import Map_Pool
+import Map_Generator
+import Text_Cache
 
 # Colores
 NEGRO = (0, 0, 0)
@@ -26,7 +29,7 @@ class Boton:
         color_borde = VERDE_CLARO if self.hover else BLANCO
         pygame.draw.rect(ventana, NEGRO, self.rect)
         pygame.draw.rect(ventana, color_borde, self.rect, 2)
-        texto_surface = self.fuente.render(self.texto, True, color_borde)
+        texto_surface = Text_Cache.renderizar(self.fuente, self.texto, True, color_borde)
         texto_rect = texto_surface.get_rect(center=self.rect.center)
         ventana.blit(texto_surface, texto_rect)
 
@@ -138,19 +141,27 @@ class PlayerNameScreen:
         self.btn_volver = Boton(ANCHO_VENTANA // 2 - 125, 500, 250, 50, "VOLVER", self.fuente_boton)
         self.btn_jugar = Boton(ANCHO_VENTANA // 2 - 125, 430, 250, 50, "JUGAR", self.fuente_boton)
 
+        # Tamaño del mapa (el grande se recorre con la cámara)
+        self.mapa_grande = False
+        self.btn_mapa = Boton(ANCHO_VENTANA - 210, 430, 190, 50, "MAPA: NORMAL", self.fuente_pequeña)
+
         reproducir_musica("ASSETS/OST/Mode_Selection.mp3")
 
+        # Ir generando mapas en segundo plano mientras se escribe el nombre
+        self.modo_mapa = "hunter" if modo == "CAZADOR" else "escape"
+        Map_Pool.pool.precargar(self.modo_mapa)
+
     def dibujar(self):
         self.ventana.fill(NEGRO)
 
         # Título
         titulo = f"Modo {self.modo}"
-        texto_titulo = self.fuente_titulo.render(titulo, True, BLANCO)
+        texto_titulo = Text_Cache.renderizar(self.fuente_titulo, titulo, True, BLANCO)
         rect_titulo = texto_titulo.get_rect(center=(ANCHO_VENTANA // 2, 60))
         self.ventana.blit(texto_titulo, rect_titulo)
 
         # Etiqueta del input
-        etiqueta = self.fuente_texto.render("Ingresa tu nombre:", True, BLANCO)
+        etiqueta = Text_Cache.renderizar(self.fuente_texto, "Ingresa tu nombre:", True, BLANCO)
         rect_etiqueta = etiqueta.get_rect(center=(ANCHO_VENTANA // 2, 120))
         self.ventana.blit(etiqueta, rect_etiqueta)
 
@@ -159,27 +170,27 @@ class PlayerNameScreen:
         pygame.draw.rect(self.ventana, color_borde, self.input_rect, 3)
 
         # Texto dentro de la caja
-        texto_surface = self.fuente_texto.render(self.nombre, True, BLANCO)
+        texto_surface = Text_Cache.renderizar(self.fuente_texto, self.nombre, True, BLANCO)
         self.ventana.blit(texto_surface, (self.input_rect.x + 10, self.input_rect.y + 5))
 
         # --- SLIDERS DE DIFICULTAD ---
         
         # Slider de enemigos
-        etiqueta_enemigos = self.fuente_pequeña.render("Número de enemigos:", True, BLANCO)
+        etiqueta_enemigos = Text_Cache.renderizar(self.fuente_pequeña, "Número de enemigos:", True, BLANCO)
         self.ventana.blit(etiqueta_enemigos, (ANCHO_VENTANA // 2 - etiqueta_enemigos.get_width() // 2, 230))
         
         self.slider_enemigos.dibujar(self.ventana)
         
-        valor_enemigos = self.fuente_pequeña.render(f"{self.slider_enemigos.obtener_valor()}", True, VERDE_CLARO)
+        valor_enemigos = Text_Cache.renderizar(self.fuente_pequeña, f"{self.slider_enemigos.obtener_valor()}", True, VERDE_CLARO)
         self.ventana.blit(valor_enemigos, (ANCHO_VENTANA // 2 - valor_enemigos.get_width() // 2, 295))
 
         # Slider de velocidad
-        etiqueta_velocidad = self.fuente_pequeña.render("Velocidad de enemigos:", True, BLANCO)
+        etiqueta_velocidad = Text_Cache.renderizar(self.fuente_pequeña, "Velocidad de enemigos:", True, BLANCO)
         self.ventana.blit(etiqueta_velocidad, (ANCHO_VENTANA // 2 - etiqueta_velocidad.get_width() // 2, 330))
         
         self.slider_velocidad.dibujar(self.ventana)
         
-        valor_velocidad = self.fuente_pequeña.render(f"{self.slider_velocidad.obtener_valor()}x", True, VERDE_CLARO)
+        valor_velocidad = Text_Cache.renderizar(self.fuente_pequeña, f"{self.slider_velocidad.obtener_valor()}x", True, VERDE_CLARO)
         self.ventana.blit(valor_velocidad, (ANCHO_VENTANA // 2 - valor_velocidad.get_width() // 2, 395))
 
         # Mostrar botones
@@ -187,6 +198,9 @@ class PlayerNameScreen:
         self.btn_volver.actualizar_hover(pos_mouse)
         self.btn_volver.dibujar(self.ventana)
 
+        self.btn_mapa.actualizar_hover(pos_mouse)
+        self.btn_mapa.dibujar(self.ventana)
+
         if self.nombre.strip() != "":
             self.btn_jugar.actualizar_hover(pos_mouse)
             self.btn_jugar.dibujar(self.ventana)
@@ -212,6 +226,9 @@ class PlayerNameScreen:
                 if self.btn_volver.es_clickeado(evento.pos):
                     self.corriendo = False
 
+                if self.btn_mapa.es_clickeado(evento.pos):
+                    self.cambiar_tamaño_mapa()
+
                 if self.nombre.strip() != "" and self.btn_jugar.es_clickeado(evento.pos):
                     detener_musica()
                     
@@ -220,10 +237,12 @@ class PlayerNameScreen:
                     velocidad_enemigos = self.slider_velocidad.obtener_valor()
                     
                     if self.modo == "CAZADOR":
-                        juego = HunterMode(self.ventana, self.nombre, num_enemigos, velocidad_enemigos)
+                        juego = HunterMode(self.ventana, self.nombre, num_enemigos, velocidad_enemigos,
+                                           self.mapa_grande)
                         volver = juego.ejecutar()
                     elif self.modo == "ESCAPE":
-                        juego = EscapeMode(self.ventana, self.nombre, num_enemigos, velocidad_enemigos)
+                        juego = EscapeMode(self.ventana, self.nombre, num_enemigos, velocidad_enemigos,
+                                           self.mapa_grande)
                         volver = juego.ejecutar()
                     
                     if volver:
@@ -241,6 +260,14 @@ class PlayerNameScreen:
                     if len(self.nombre) < 15:
                         self.nombre += evento.unicode
 
+    def cambiar_tamaño_mapa(self):
+        self.mapa_grande = not self.mapa_grande
+        self.btn_mapa.texto = "MAPA: GRANDE" if self.mapa_grande else "MAPA: NORMAL"
+
+        # Empezar a generar mapas del tamaño elegido
+        if self.mapa_grande:
+            Map_Pool.pool.precargar(self.modo_mapa, Map_Generator.MAP_ROWS_GRANDE, Map_Generator.MAP_COLS_GRANDE)
+
     def ejecutar(self):
         while self.corriendo:
             self.manejar_eventos()
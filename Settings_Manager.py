@@ -0,0 +1,69 @@
+import json
+import os
+
+CONFIG_FILE = "settings.json"
+
+VALORES_POR_DEFECTO = {
+    "musica_activada": True,
+    "efectos_activados": True,
+    "volumen_musica": 5,
+    "volumen_efectos": 5,
+    # Fondo quieto por defecto: los modos de juego solo redibujan lo que cambia;
+    # con el fondo animado toda la pantalla cambia en cada frame
+    "fondo_animado": False
+}
+
+# Configuración en memoria: se lee del disco una sola vez
+configuracion = None
+# Fecha de modificación del archivo cuando se leyó (None si no existía)
+fecha_leida = None
+
+
+def fecha_archivo():
+    try:
+        return os.stat(CONFIG_FILE).st_mtime_ns
+    except OSError:
+        return None
+
+
+def leer_archivo():
+    """Lee settings.json completando las claves que falten con los valores por defecto"""
+    global configuracion, fecha_leida
+
+    config = dict(VALORES_POR_DEFECTO)
+    fecha_leida = fecha_archivo()
+    if fecha_leida is not None:
+        try:
+            with open(CONFIG_FILE, "r") as f:
+                config.update(json.load(f))
+        except (OSError, ValueError) as e:
+            print(f"Error al leer la configuración: {e}")
+    configuracion = config
+
+
+def obtener():
+    """Configuración actual (sin tocar el disco después de la primera lectura)
+
+    El diccionario es compartido: para modificarlo usar una copia y guardar().
+    """
+    if configuracion is None:
+        leer_archivo()
+    return configuracion
+
+
+def refrescar():
+    """Vuelve a leer settings.json solo si cambió en el disco desde la última lectura"""
+    if configuracion is None or fecha_archivo() != fecha_leida:
+        leer_archivo()
+    return configuracion
+
+
+def guardar(config):
+    """Guarda la configuración en settings.json y actualiza la copia en memoria"""
+    global configuracion, fecha_leida
+
+    configuracion = dict(VALORES_POR_DEFECTO)
+    configuracion.update(config)
+    with open(CONFIG_FILE, "w") as f:
+        json.dump(configuracion, f, indent=4)
+    fecha_leida = fecha_archivo()
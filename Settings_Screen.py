@@ -1,7 +1,8 @@
 import pygame
 import sys
-import json
-import os
+import Settings_Manager
+import Music_Manager
+import Text_Cache
 
 # --- Constantes ---
 ANCHO_VENTANA = 800
@@ -14,8 +15,6 @@ VERDE_OSCURO = (0, 150, 0)
 ROJO = (220, 20, 60)
 GRIS = (100, 100, 100)
 
-CONFIG_FILE = "settings.json"
-
 
 class Boton:
     def __init__(self, x, y, ancho, alto, texto, fuente, color_activado, color_desactivado, activo=True):
@@ -33,7 +32,7 @@ class Boton:
         pygame.draw.rect(ventana, BLANCO, self.rect, 2)
 
         color_texto = BLANCO if not self.hover else (144, 238, 144)
-        texto_surface = self.fuente.render(self.texto, True, color_texto)
+        texto_surface = Text_Cache.renderizar(self.fuente, self.texto, True, color_texto)
         texto_rect = texto_surface.get_rect(center=self.rect.center)
         ventana.blit(texto_surface, texto_rect)
 
@@ -101,31 +100,19 @@ class SettingsScreen:
         self.volumen_previo_musica = self.config["volumen_musica"]
         self.volumen_previo_efectos = self.config["volumen_efectos"]
 
-        # Cargar sonido de prueba
-        self.sonido_eliminated = pygame.mixer.Sound("ASSETS/SOUND EFFECTS/Eliminated.mp3")
+        # Sonido de prueba (desde la caché de efectos que llena la precarga; None si no se pudo cargar)
+        self.sonido_eliminated = Music_Manager.cargar_efecto("Eliminated")
 
         # Crear elementos
         self.crear_elementos()
 
     # --- Configuración guardada ---
     def cargar_configuracion(self):
-        if not os.path.exists(CONFIG_FILE):
-            config = {
-                "musica_activada": True,
-                "efectos_activados": True,
-                "volumen_musica": 5,
-                "volumen_efectos": 5
-            }
-            with open(CONFIG_FILE, "w") as f:
-                json.dump(config, f, indent=4)
-        else:
-            with open(CONFIG_FILE, "r") as f:
-                config = json.load(f)
-        return config
+        # Copia propia: los cambios solo se aplican al juego al guardar
+        return dict(Settings_Manager.refrescar())
 
     def guardar_configuracion(self):
-        with open(CONFIG_FILE, "w") as f:
-            json.dump(self.config, f, indent=4)
+        Settings_Manager.guardar(self.config)
 
     # --- Crear botones y sliders ---
     def crear_elementos(self):
@@ -134,34 +121,43 @@ class SettingsScreen:
         x_centro = ANCHO_VENTANA // 2 - ancho_boton // 2
 
         self.btn_musica = Boton(
-            x_centro, 200, ancho_boton, alto_boton,
+            x_centro, 160, ancho_boton, alto_boton,
             f"Música: {'Activada' if self.config['musica_activada'] else 'Desactivada'}",
             self.fuente_boton, VERDE_OSCURO, ROJO, self.config["musica_activada"]
         )
 
-        self.slider_musica = Slider(x_centro, 270, 300, self.config["volumen_musica"])
+        self.slider_musica = Slider(x_centro, 225, 300, self.config["volumen_musica"])
 
         self.btn_efectos = Boton(
-            x_centro, 360, ancho_boton, alto_boton,
+            x_centro, 300, ancho_boton, alto_boton,
             f"Efectos: {'Activados' if self.config['efectos_activados'] else 'Desactivados'}",
             self.fuente_boton, VERDE_OSCURO, ROJO, self.config["efectos_activados"]
         )
 
-        self.slider_efectos = Slider(x_centro, 430, 300, self.config["volumen_efectos"])
+        self.slider_efectos = Slider(x_centro, 365, 300, self.config["volumen_efectos"])
+
+        self.btn_fondo = Boton(
+            x_centro, 440, ancho_boton, alto_boton,
+            self.texto_fondo(),
+            self.fuente_boton, VERDE_OSCURO, ROJO, self.config["fondo_animado"]
+        )
 
         self.btn_volver = Boton(
             x_centro, 520, ancho_boton, alto_boton,
             "Volver", self.fuente_boton, NEGRO, NEGRO
         )
 
-        self.botones = [self.btn_musica, self.btn_efectos, self.btn_volver]
+        self.botones = [self.btn_musica, self.btn_efectos, self.btn_fondo, self.btn_volver]
+
+    def texto_fondo(self):
+        return f"Fondo: {'Animado' if self.config['fondo_animado'] else 'Quieto'}"
 
     # --- Dibujar pantalla ---
     def dibujar(self):
         self.ventana.fill(NEGRO)
 
-        titulo = self.fuente_titulo.render("CONFIGURACIÓN", True, BLANCO)
-        self.ventana.blit(titulo, titulo.get_rect(center=(ANCHO_VENTANA // 2, 100)))
+        titulo = Text_Cache.renderizar(self.fuente_titulo, "CONFIGURACIÓN", True, BLANCO)
+        self.ventana.blit(titulo, titulo.get_rect(center=(ANCHO_VENTANA // 2, 80)))
 
         pos_mouse = pygame.mouse.get_pos()
         for boton in self.botones:
@@ -172,11 +168,11 @@ class SettingsScreen:
         self.slider_musica.dibujar(self.ventana)
         self.slider_efectos.dibujar(self.ventana)
 
-        texto_musica = self.fuente_texto.render(f"Volumen Música: {self.slider_musica.obtener_valor()}", True, BLANCO)
-        self.ventana.blit(texto_musica, (ANCHO_VENTANA // 2 - texto_musica.get_width() // 2, 310))
+        texto_musica = Text_Cache.renderizar(self.fuente_texto, f"Volumen Música: {self.slider_musica.obtener_valor()}", True, BLANCO)
+        self.ventana.blit(texto_musica, (ANCHO_VENTANA // 2 - texto_musica.get_width() // 2, 250))
 
-        texto_efectos = self.fuente_texto.render(f"Volumen Efectos: {self.slider_efectos.obtener_valor()}", True, BLANCO)
-        self.ventana.blit(texto_efectos, (ANCHO_VENTANA // 2 - texto_efectos.get_width() // 2, 470))
+        texto_efectos = Text_Cache.renderizar(self.fuente_texto, f"Volumen Efectos: {self.slider_efectos.obtener_valor()}", True, BLANCO)
+        self.ventana.blit(texto_efectos, (ANCHO_VENTANA // 2 - texto_efectos.get_width() // 2, 390))
 
         pygame.display.flip()
 
@@ -204,16 +200,25 @@ class SettingsScreen:
             if self.config["efectos_activados"]:
                 valor_restaurado = self.volumen_previo_efectos if self.volumen_previo_efectos > 0 else 1
                 self.slider_efectos.establecer_valor(valor_restaurado)
-                self.sonido_eliminated.set_volume(valor_restaurado / 10)
-                self.sonido_eliminated.play()
+                self.probar_efecto(valor_restaurado)
             else:
                 self.volumen_previo_efectos = self.slider_efectos.obtener_valor()
                 self.slider_efectos.establecer_valor(0)
 
+        elif self.btn_fondo.es_clickeado(pos_mouse):
+            self.config["fondo_animado"] = not self.config["fondo_animado"]
+            self.btn_fondo.activo = self.config["fondo_animado"]
+            self.btn_fondo.texto = self.texto_fondo()
+
         elif self.btn_volver.es_clickeado(pos_mouse):
             self.guardar_configuracion()
             self.activo = False
 
+    def probar_efecto(self, volumen):
+        if self.sonido_eliminated is not None:
+            self.sonido_eliminated.set_volume(volumen / 10)
+            self.sonido_eliminated.play()
+
     # --- Bucle principal ---
     def ejecutar(self):
         self.activo = True
@@ -233,8 +238,7 @@ class SettingsScreen:
                 if evento.type == pygame.MOUSEBUTTONUP and self.slider_efectos.suelto:
                     self.slider_efectos.suelto = False
                     if self.config["efectos_activados"] and self.slider_efectos.obtener_valor() > 0:
-                        self.sonido_eliminated.set_volume(self.slider_efectos.obtener_valor() / 10)
-                        self.sonido_eliminated.play()
+                        self.probar_efecto(self.slider_efectos.obtener_valor())
 
             # Actualizar volúmenes en tiempo real
             musica_valor = self.slider_musica.obtener_valor()
@@ -0,0 +1,395 @@
+import pygame
+import random
+
+from Escape_Hud import EnergyBar
+from Player import Player
+from Enemy import Enemy
+from Trap import TrapManager
+from Occupancy_Grid import OccupancyGrid
+from Pathfinding import DistanceField, FleeMap, TRANSITABLES
+from Map_Generator import region_enemigos
+from Spawn_Index import SpawnIndex
+import Map_Pool
+import Map_Generator
+
+'''Núcleo de la partida sin ventana ni reloj
+
+Los modos de juego dibujan y leen el teclado; aquí solo vive la lógica
+(mapa, jugador, enemigos, trampas, puntaje y tiempo), de modo que una
+partida se puede avanzar tick a tick tan rápido como se quiera.
+'''
+
+TILE = 25
+TICKS_POR_SEGUNDO = 10
+DURACION_PARTIDA = 120
+
+
+class TeclasSimuladas:
+    """Estado de teclado que se consulta igual que pygame.key.get_pressed()"""
+
+    def __init__(self, presionadas=()):
+        self.presionadas = set(presionadas)
+
+    def __getitem__(self, tecla):
+        return tecla in self.presionadas
+
+
+class EntradaScriptada:
+    """Fuente de entrada para simular partidas sin teclado
+
+    El guion puede ser una lista con las teclas de cada tick o una
+    función guion(simulacion) que devuelve las teclas del tick actual.
+    """
+
+    def __init__(self, guion):
+        self.guion = guion
+
+    def teclas(self, simulacion):
+        if callable(self.guion):
+            return self.guion(simulacion)
+        if simulacion.ticks < len(self.guion):
+            return self.guion[simulacion.ticks]
+        return ()
+
+
+class Simulacion:
+    def __init__(self, modo, num_enemigos=2, velocidad_enemigos=1.0,
+                 duracion=DURACION_PARTIDA, energia=None, semilla=None,
+                 filas=Map_Generator.MAP_ROWS, columnas=Map_Generator.MAP_COLS):
+        self.modo = modo
+        self.num_enemigos = num_enemigos
+        self.velocidad_enemigos = velocidad_enemigos
+        self.duracion = duracion
+
+        # Mapa (pre-generado en el pool si no se pide una semilla concreta)
+        self.semilla, self.mapa, self.inicio, self.salida = Map_Pool.pool.obtener(
+            modo, semilla, filas, columnas)
+        # El resto de la aleatoriedad de la partida también depende de la semilla
+        self.rng = random.Random(self.semilla)
+        self.filas = self.mapa.filas
+        self.columnas = self.mapa.columnas
+
+        # Quién ocupa cada casilla (jugador, enemigos vivos y trampas)
+        self.ocupacion = OccupancyGrid()
+
+        # Jugador
+        self.jugador = Player(self.inicio[0], self.inicio[1], TILE, modo=modo)
+        self.jugador.set_ocupacion(self.ocupacion)
+        self.energia = energia if energia is not None else EnergyBar(max_energy=100, x=0, y=0)
+
+        # Enemigos
+        self.enemigos = []
+        # velocidad 1.0 = 8 ticks, 1.5 = ~5 ticks, 2.0 = 4 ticks
+        self.frames_por_movimiento = int(8 / velocidad_enemigos)
+        # Los enemigos solo aparecen en la región desde la que llegan a su
+        # objetivo: el jugador en escape (Hunters), la salida en hunter (Runners)
+        self.regiones_enemigos, self.region_enemigos = region_enemigos(
+            self.mapa, modo, self.inicio, self.salida)
+
+        # Estado de la partida
+        self.puntos = 0
+        self.tiempo = 0.0
+        self.ticks = 0
+        self.resultado = None
+        self.eventos = []
+
+        # Casillas donde pueden aparecer enemigos (se calculan una sola vez)
+        self.casillas_aparicion = SpawnIndex(self.casillas_validas(self.es_posicion_inicial_valida))
+        self.crear_enemigos()
+
+    def get_tiempo_restante(self):
+        return max(self.duracion - self.tiempo, 0)
+
+    def terminar(self, resultado):
+        self.resultado = resultado
+
+    def paso(self, teclas, dt=1 / TICKS_POR_SEGUNDO):
+        """Avanza un tick y retorna los eventos ocurridos ("eliminado", ...)"""
+        self.eventos = []
+        if self.resultado is not None:
+            return self.eventos
+
+        # Verificar si el tiempo terminó
+        if self.tiempo >= self.duracion:
+            self.terminar("tiempo")
+            return self.eventos
+
+        self.verificar_estado()
+
+        if self.resultado is None:
+            # Posiciones al inicio del tick (para dibujar interpolando)
+            self.jugador.guardar_posicion_anterior()
+            for enemigo in self.enemigos:
+                enemigo.guardar_posicion_anterior()
+
+            self.actualizar(teclas, dt)
+
+            # Manejar energía
+            if self.jugador.corriendo:
+                self.energia.drain(dt)
+            else:
+                self.energia.recover(dt)
+
+            self.tiempo += dt
+            self.ticks += 1
+
+        return self.eventos
+
+    def ejecutar(self, entrada, dt=1 / TICKS_POR_SEGUNDO, max_ticks=None):
+        """Juega la partida completa sin ventana y retorna el resultado"""
+        while self.resultado is None:
+            if max_ticks is not None and self.ticks >= max_ticks:
+                break
+            teclas = entrada.teclas(self)
+            self.aplicar_acciones(teclas)
+            self.paso(TeclasSimuladas(teclas), dt)
+        return self.resultado
+
+    def aplicar_acciones(self, teclas):
+        """Acciones de una sola pulsación (en el juego llegan como KEYDOWN)"""
+        pass
+
+    def verificar_estado(self):
+        """Revisa colisiones y condiciones de fin antes de mover a nadie"""
+        pass
+
+    def actualizar(self, teclas, dt):
+        pass
+
+    def casillas_validas(self, es_valida):
+        """Casillas a 2 o más del borde del mapa que cumplen es_valida(fila, col)"""
+        return [(fila, col)
+                for fila in range(2, self.filas - 2)
+                for col in range(2, self.columnas - 2)
+                if es_valida(fila, col)]
+
+    def crear_enemigos(self):
+        """Crea los enemigos en posiciones aleatorias del mapa"""
+        while len(self.enemigos) < self.num_enemigos:
+            if not self.crear_un_enemigo():
+                break
+
+    def crear_un_enemigo(self):
+        """Crea un enemigo nuevo en posición aleatoria (False si no hay dónde)"""
+        casilla = self.casillas_aparicion.elegir(self.rng)
+        if casilla is None:
+            return False
+
+        enemigo = Enemy(casilla[0], casilla[1], TILE, modo=self.modo)
+        enemigo.frames_por_movimiento = self.frames_por_movimiento
+        self.preparar_enemigo(enemigo)
+        enemigo.set_ocupacion(self.ocupacion)
+        self.enemigos.append(enemigo)
+        return True
+
+    def quitar_enemigo(self, enemigo):
+        """Saca al enemigo de la partida y crea otro en su lugar"""
+        enemigo.salir_de_ocupacion()
+        self.enemigos.remove(enemigo)
+        self.crear_un_enemigo()
+
+    def enemigos_en(self, pos):
+        """Enemigos vivos en la casilla"""
+        return self.ocupacion.en(pos, Enemy)
+
+    def en_region_enemigos(self, fila, col):
+        return self.regiones_enemigos.region(fila, col) == self.region_enemigos
+
+    def es_posicion_inicial_valida(self, fila, col):
+        # Verificar que sea camino, conectado con el objetivo de los enemigos y lejos del inicio y salida
+        return (self.mapa.casilla(fila, col) == "P" and
+                self.en_region_enemigos(fila, col) and
+                abs(fila - self.inicio[0]) + abs(col - self.inicio[1]) >= 5 and
+                (fila, col) != self.salida)
+
+    def preparar_enemigo(self, enemigo):
+        pass
+
+
+class SimulacionEscape(Simulacion):
+    def __init__(self, num_enemigos=2, velocidad_enemigos=1.0,
+                 duracion=DURACION_PARTIDA, energia=None, semilla=None,
+                 filas=Map_Generator.MAP_ROWS, columnas=Map_Generator.MAP_COLS):
+        super().__init__("escape", num_enemigos, velocidad_enemigos, duracion, energia, semilla,
+                         filas, columnas)
+
+        # Casillas de reaparición: en este modo los enemigos son Hunters, así que sirven
+        # caminos y lianas de su región (los túneles son de los Runners y quedan fuera)
+        self.casillas_reaparicion = SpawnIndex(self.casillas_validas(self.es_posicion_reaparicion_valida))
+
+        # Sistema de trampas (en la misma grilla que el jugador y los enemigos)
+        self.trap_manager = TrapManager(max_trampas=3, cooldown=5.0, ocupacion=self.ocupacion)
+        self.puntos_por_enemigo_trampa = 50
+        # Distancia mínima al jugador para reaparecer
+        self.distancia_reaparicion = 5
+
+        # Campo de distancias hacia el jugador compartido por todos los enemigos
+        self.campo_jugador = DistanceField(TRANSITABLES["Hunter"])
+
+    def colocar_trampa(self):
+        """Intenta colocar una trampa en la posición actual del jugador"""
+        jugador_pos = self.jugador.get_posicion()
+
+        # Verificar que sea una casilla válida (P, L o T)
+        if self.mapa.casilla(jugador_pos[0], jugador_pos[1]) not in ["P", "L", "T"]:
+            return False
+
+        return self.trap_manager.colocar_trampa(
+            jugador_pos[0],
+            jugador_pos[1],
+            TILE,
+            self.tiempo
+        )
+
+    def aplicar_acciones(self, teclas):
+        if pygame.K_SPACE in teclas:
+            self.colocar_trampa()
+
+    def verificar_estado(self):
+        # Verificar si el jugador llegó a la salida
+        if self.jugador.llego_a_salida:
+            # Calcular puntos bonus por tiempo restante
+            puntos_bonus = int(self.get_tiempo_restante() * 10)  # 10 puntos por segundo
+            self.puntos += puntos_bonus
+            self.terminar("salida")
+            return
+
+        # Verificar colisiones con enemigos (solo los de la casilla del jugador)
+        jugador_pos = self.jugador.get_posicion()
+        for enemigo in self.enemigos_en(jugador_pos):
+            if enemigo.colisiona_con_jugador(jugador_pos):
+                # Game Over - El jugador fue atrapado
+                self.eventos.append("eliminado")
+                self.terminar("atrapado")
+                return
+
+    def actualizar(self, teclas, dt):
+        # Los enemigos persiguen la posición del jugador al inicio del tick
+        jugador_pos = self.jugador.get_posicion()
+        tiempo_actual = self.tiempo
+
+        # Actualizar jugador
+        self.jugador.mover(teclas, self.mapa, self.energia)
+
+        # Actualizar enemigos (un solo BFS por movimiento del jugador)
+        self.campo_jugador.actualizar(jugador_pos, self.mapa)
+        for enemigo in self.enemigos:
+            enemigo.actualizar(jugador_pos, self.mapa, tiempo_actual, self.campo_jugador)
+
+        # Actualizar trampas
+        self.trap_manager.actualizar(tiempo_actual)
+
+        # Verificar colisiones trampa-enemigo
+        enemigos_eliminados = self.trap_manager.verificar_colisiones(tiempo_actual)
+
+        # Dar puntos por enemigos eliminados
+        if enemigos_eliminados > 0:
+            self.puntos += enemigos_eliminados * self.puntos_por_enemigo_trampa
+            self.eventos.append("eliminado")
+
+        # Reaparición de enemigos muertos
+        for enemigo in self.enemigos:
+            if not enemigo.vivo and enemigo.puede_reaparecer(tiempo_actual):
+                self.reaparecer_enemigo(enemigo, jugador_pos)
+
+    def es_posicion_reaparicion_valida(self, fila, col):
+        # Camino o liana en la región de los enemigos (un túnel nunca está en la región de los Hunters)
+        return (self.mapa.casilla(fila, col) in ["P", "L", "T"] and
+                self.en_region_enemigos(fila, col))
+
+    def reaparecer_enemigo(self, enemigo, jugador_pos):
+        # Posición aleatoria válida y lejos del jugador
+        casilla = self.casillas_reaparicion.elegir(self.rng, jugador_pos, self.distancia_reaparicion)
+        if casilla is not None:
+            enemigo.reaparecer(*casilla)
+
+
+class SimulacionHunter(Simulacion):
+    def __init__(self, num_enemigos=2, velocidad_enemigos=1.0,
+                 duracion=DURACION_PARTIDA, energia=None, semilla=None,
+                 filas=Map_Generator.MAP_ROWS, columnas=Map_Generator.MAP_COLS):
+        # Sistema de puntuación para modo Hunter
+        self.puntos_perdida_por_escape = 100
+        self.puntos_ganancia_por_captura = 200
+
+        # Mapa de huida compartido por todos los Runners (el jugador es el Hunter)
+        self.mapa_huida = FleeMap(TRANSITABLES["Runner"], TRANSITABLES["Hunter"])
+
+        super().__init__("hunter", num_enemigos, velocidad_enemigos, duracion, energia, semilla,
+                         filas, columnas)
+
+        # La salida no se mueve: su campo de distancias se calcula una sola vez
+        self.campo_salida = DistanceField(TRANSITABLES["Runner"])
+        self.campo_salida.actualizar(self.salida, self.mapa)
+
+    def es_posicion_inicial_valida(self, fila, col):
+        # Verificar que esté LEJOS de la salida (al menos 10 casillas)
+        distancia_a_salida = abs(fila - self.salida[0]) + abs(col - self.salida[1])
+        return super().es_posicion_inicial_valida(fila, col) and distancia_a_salida >= 10
+
+    def preparar_enemigo(self, enemigo):
+        # Establecer la posición de la salida para que el enemigo sepa hacia dónde huir
+        enemigo.set_salida(self.salida)
+
+    def verificar_estado(self):
+        # Verificar si algún enemigo llegó a la salida
+        enemigos_a_eliminar = []
+        for enemigo in self.enemigos_en(self.salida):
+            if enemigo.llego_a_salida():
+                self.eventos.append("eliminado")
+                # Restar puntos
+                self.puntos -= self.puntos_perdida_por_escape
+                enemigos_a_eliminar.append(enemigo)
+
+        # Eliminar enemigos que escaparon y crear nuevos
+        for enemigo in enemigos_a_eliminar:
+            self.quitar_enemigo(enemigo)
+
+        # Verificar colisiones con enemigos
+        jugador_pos = self.jugador.get_posicion()
+        enemigos_atrapados = []
+        for enemigo in self.enemigos_en(jugador_pos):
+            if enemigo.colisiona_con_jugador(jugador_pos):
+                self.eventos.append("eliminado")
+                # Dar puntos por captura
+                self.puntos += self.puntos_ganancia_por_captura
+                enemigos_atrapados.append(enemigo)
+
+        # Eliminar enemigos atrapados y crear nuevos
+        for enemigo in enemigos_atrapados:
+            self.quitar_enemigo(enemigo)
+
+    def actualizar(self, teclas, dt):
+        # Los enemigos huyen de la posición del jugador al inicio del tick
+        jugador_pos = self.jugador.get_posicion()
+
+        # Actualizar jugador
+        self.jugador.mover(teclas, self.mapa, self.energia)
+
+        # Actualizar enemigos (el mapa de huida se recalcula solo si el jugador se movió)
+        self.mapa_huida.actualizar(jugador_pos, self.salida, self.mapa)
+        for enemigo in self.enemigos:
+            enemigo.actualizar(jugador_pos, self.mapa, self.tiempo,
+                               mapa_huida=self.mapa_huida, campo_salida=self.campo_salida)
+
+
+def simular_partida(modo, entrada, num_enemigos=2, velocidad_enemigos=1.0,
+                    max_ticks=None, semilla=None):
+    """Juega una partida sin ventana y retorna un resumen del resultado
+
+    Con la misma semilla y la misma entrada el resultado es idéntico.
+    """
+    if modo == "escape":
+        simulacion = SimulacionEscape(num_enemigos, velocidad_enemigos, semilla=semilla)
+    else:
+        simulacion = SimulacionHunter(num_enemigos, velocidad_enemigos, semilla=semilla)
+
+    simulacion.ejecutar(entrada, max_ticks=max_ticks)
+
+    return {
+        "semilla": simulacion.semilla,
+        "resultado": simulacion.resultado,
+        "puntos": simulacion.puntos,
+        "ticks": simulacion.ticks,
+        "tiempo": simulacion.tiempo,
+    }
@@ -0,0 +1,44 @@
+'''Índice de casillas de aparición
+
+Las casillas donde puede aparecer un enemigo se calculan una sola vez por
+partida. Elegir una es tomar una al azar de la lista; si se pide estar
+lejos del jugador, solo se descartan las pocas casillas cercanas a él.
+'''
+
+# Sorteos al azar antes de filtrar toda la lista
+INTENTOS_RAPIDOS = 8
+
+
+def manhattan(a, b):
+    return abs(a[0] - b[0]) + abs(a[1] - b[1])
+
+
+class SpawnIndex:
+    def __init__(self, casillas):
+        self.casillas = list(casillas)
+
+    def __len__(self):
+        return len(self.casillas)
+
+    def elegir(self, rng, lejos_de=None, distancia_minima=0):
+        """Casilla al azar a 'distancia_minima' o más de 'lejos_de' (None si no hay ninguna)
+
+        Casi siempre basta con un sorteo: las casillas cercanas a una posición
+        son pocas. Si los sorteos fallan se filtra la lista, así que siempre se
+        encuentra una casilla cuando existe.
+        """
+        if not self.casillas:
+            return None
+        if lejos_de is None:
+            return rng.choice(self.casillas)
+
+        for _ in range(INTENTOS_RAPIDOS):
+            casilla = rng.choice(self.casillas)
+            if manhattan(casilla, lejos_de) >= distancia_minima:
+                return casilla
+
+        validas = [casilla for casilla in self.casillas
+                   if manhattan(casilla, lejos_de) >= distancia_minima]
+        if not validas:
+            return None
+        return rng.choice(validas)
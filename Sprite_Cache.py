@@ -0,0 +1,130 @@
+import pygame
+from PIL import Image
+
+import Display_Format
+
+# Caché de sprites compartida por todo el juego
+# (ruta, tamaño) -> Surface escalada, o None si no se pudo cargar
+#
+# Como en Gif_Cache, leer_imagen() decodifica con PIL sin usar pygame (se
+# puede llamar desde el hilo de precarga) y agregar_sprite() crea la
+# superficie en el hilo principal.
+sprites_cargados = {}
+
+# (rol, tile_size, color_respaldo) -> {direccion: [frame1, frame2, frame3]}
+personajes_cargados = {}
+
+# tile_size -> [Trap 1 ... Trap 5]
+trampas_cargadas = {}
+
+DIRECCIONES = ["Up", "Down", "Left", "Right"]
+
+
+def cargar_sprite(ruta, tamaño):
+    """Devuelve el sprite escalado desde la caché (lo carga del disco solo la primera vez)"""
+    clave = (ruta, tamaño)
+    if clave not in sprites_cargados:
+        agregar_sprite(ruta, tamaño, leer_imagen(ruta))
+    return sprites_cargados[clave]
+
+
+def leer_imagen(ruta):
+    """(bytes RGBA, tamaño) de la imagen, o None si no se pudo leer; no usa pygame"""
+    try:
+        with Image.open(ruta) as imagen:
+            imagen = imagen.convert("RGBA")
+            return imagen.tobytes(), imagen.size
+    except Exception as e:
+        print(f"Error al cargar sprite: {ruta} - {e}")
+        return None
+
+
+def agregar_sprite(ruta, tamaño, imagen):
+    """Crea el sprite escalado a partir de leer_imagen() y lo guarda en la caché (hilo principal)"""
+    sprite = None
+    if imagen is not None:
+        datos, tamaño_original = imagen
+        sprite = pygame.image.fromstring(datos, tamaño_original, "RGBA")
+        sprite = pygame.transform.scale(sprite, tamaño)
+        # Formato de la pantalla (con alpha solo si la imagen lo usa)
+        sprite = Display_Format.convertir(sprite)
+    sprites_cargados[(ruta, tamaño)] = sprite
+    return sprite
+
+
+def crear_respaldo_personaje(tile_size, color):
+    """Crea un sprite de respaldo (círculo de color) si no se pueden cargar las imágenes"""
+    superficie = pygame.Surface((tile_size, tile_size), pygame.SRCALPHA)
+    pygame.draw.circle(superficie, color,
+                       (tile_size // 2, tile_size // 2),
+                       tile_size // 3)
+    return Display_Format.convertir(superficie, alpha=True)
+
+
+def crear_respaldo_trampa(tile_size):
+    """Crea un sprite de respaldo (triángulo rojo) si no se pueden cargar las imágenes"""
+    superficie = pygame.Surface((tile_size, tile_size), pygame.SRCALPHA)
+    puntos = [
+        (tile_size // 2, 5),
+        (tile_size - 5, tile_size - 5),
+        (5, tile_size - 5)
+    ]
+    pygame.draw.polygon(superficie, (255, 0, 0), puntos)
+    pygame.draw.polygon(superficie, (200, 0, 0), puntos, 2)
+    return Display_Format.convertir(superficie, alpha=True)
+
+
+def cargar_sprites_personaje(rol, tile_size, color_respaldo):
+    """Sprites de un personaje por dirección; las instancias comparten el mismo diccionario"""
+    clave = (rol, tile_size, color_respaldo)
+    if clave not in personajes_cargados:
+        sprites = {}
+        for direccion in DIRECCIONES:
+            sprites[direccion] = []
+            for num in [1, 2, 3]:
+                ruta = f"ASSETS/SPRITES/Characters/{rol}/{rol} {direccion} {num}.png"
+                sprite = cargar_sprite(ruta, (tile_size, tile_size))
+                if sprite is None:
+                    sprite = crear_respaldo_personaje(tile_size, color_respaldo)
+                sprites[direccion].append(sprite)
+        personajes_cargados[clave] = sprites
+    return personajes_cargados[clave]
+
+
+def cargar_sprites_trampa(tile_size):
+    """Sprites de la trampa (Trap 1 a Trap 5) compartidos por todas las trampas"""
+    if tile_size not in trampas_cargadas:
+        sprites = []
+        for num in range(1, 6):
+            ruta = f"ASSETS/SPRITES/Trap/Trap {num}.png"
+            sprite = cargar_sprite(ruta, (tile_size, tile_size))
+            if sprite is None:
+                sprite = crear_respaldo_trampa(tile_size)
+            sprites.append(sprite)
+        trampas_cargadas[tile_size] = sprites
+    return trampas_cargadas[tile_size]
+
+
+def reconvertir():
+    """Pasa al formato de la ventana todo lo que ya está en la caché"""
+    # Los personajes y las trampas comparten superficies con sprites_cargados
+    convertidas = {}
+
+    def convertir(superficie):
+        if superficie is None:
+            return None
+        if id(superficie) not in convertidas:
+            convertidas[id(superficie)] = Display_Format.convertir(superficie)
+        return convertidas[id(superficie)]
+
+    for clave, sprite in sprites_cargados.items():
+        sprites_cargados[clave] = convertir(sprite)
+    # Las listas se modifican en su lugar: los personajes ya creados las comparten
+    for sprites in personajes_cargados.values():
+        for frames in sprites.values():
+            frames[:] = [convertir(frame) for frame in frames]
+    for frames in trampas_cargadas.values():
+        frames[:] = [convertir(frame) for frame in frames]
+
+
+Display_Format.al_crear_ventana.append(reconvertir)
@@ -0,0 +1,44 @@
+from collections import OrderedDict
+
+import Display_Format
+
+'''Caché de textos renderizados
+
+Rasterizar un texto con font.render() es caro y los menús y el HUD
+dibujan los mismos textos en cada frame. Cada texto se renderiza una vez
+por (fuente, texto, antialias, color, fondo) y se guarda ya convertido al
+formato de la ventana; los menos usados se descartan cuando hay más de
+MAX_TEXTOS.
+'''
+
+# Textos guardados a la vez (los menús y el HUD usan unas pocas decenas)
+MAX_TEXTOS = 256
+
+# (fuente, texto, antialias, color, fondo) -> Surface
+textos = OrderedDict()
+
+
+def renderizar(fuente, texto, antialias, color, fondo=None):
+    """Lo mismo que fuente.render(), pero cada texto se renderiza una sola vez"""
+    clave = (fuente, texto, antialias, tuple(color), None if fondo is None else tuple(fondo))
+    superficie = textos.get(clave)
+    if superficie is None:
+        if fondo is None:
+            superficie = fuente.render(texto, antialias, color)
+        else:
+            superficie = fuente.render(texto, antialias, color, fondo)
+        superficie = Display_Format.convertir(superficie)
+        textos[clave] = superficie
+        while len(textos) > MAX_TEXTOS:
+            textos.popitem(last=False)
+    else:
+        textos.move_to_end(clave)
+    return superficie
+
+
+def limpiar():
+    """Descarta todos los textos (se vuelven a renderizar en el formato nuevo)"""
+    textos.clear()
+
+
+Display_Format.al_crear_ventana.append(limpiar)
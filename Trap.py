@@ -1,5 +1,9 @@
 import pygame
 
+import Sprite_Cache
+from Enemy import Enemy
+from Occupancy_Grid import OccupancyGrid
+
 class Trap:
     def __init__(self, fila, col, tile_size):
         self.fila = fila
@@ -22,35 +26,8 @@ class Trap:
         self.frames_por_sprite = 2
         
     def cargar_sprites(self):
-        """Carga los sprites de la trampa (Trap 1 a Trap 5)"""
-        sprites = []
-        
-        for num in range(1, 6):
-            ruta = f"ASSETS/SPRITES/Trap/Trap {num}.png"
-            try:
-                sprite = pygame.image.load(ruta)
-                sprite = pygame.transform.scale(sprite, (self.tile_size, self.tile_size))
-                sprites.append(sprite)
-            except Exception as e:
-                print(f"Error al cargar sprite trampa: {ruta} - {e}")
-                # Sprite de respaldo (triángulo rojo)
-                sprite = self.crear_sprite_respaldo()
-                sprites.append(sprite)
-        
-        return sprites
-    
-    def crear_sprite_respaldo(self):
-        """Crea un sprite de respaldo si no se pueden cargar las imágenes"""
-        superficie = pygame.Surface((self.tile_size, self.tile_size), pygame.SRCALPHA)
-        # Dibujar un triángulo rojo (señal de peligro)
-        puntos = [
-            (self.tile_size // 2, 5),
-            (self.tile_size - 5, self.tile_size - 5),
-            (5, self.tile_size - 5)
-        ]
-        pygame.draw.polygon(superficie, (255, 0, 0), puntos)
-        pygame.draw.polygon(superficie, (200, 0, 0), puntos, 2)
-        return superficie
+        """Obtiene los sprites de la trampa (Trap 1 a Trap 5) desde la caché compartida"""
+        return Sprite_Cache.cargar_sprites_trampa(self.tile_size)
     
     def activar(self):
         """Activa la trampa (inicia la animación de activación)"""
@@ -84,27 +61,35 @@ class Trap:
         return self.activa and (self.fila, self.col) == enemigo_pos
     
     def dibujar(self, ventana, margen_x, margen_y):
+        """Dibuja la trampa y retorna la zona de la ventana que pintó (None si ya no está)"""
         if self.debe_desaparecer:
-            return
+            return None
         
         x = margen_x + (self.col * self.tile_size)
         y = margen_y + (self.fila * self.tile_size)
         
         # Obtener sprite actual
         sprite = self.sprites[self.frame_actual - 1]
-        ventana.blit(sprite, (x, y))
+        return ventana.blit(sprite, (x, y))
     
     def get_posicion(self):
         """Retorna la posición de la trampa"""
         return (self.fila, self.col)
+    
+    def esta_puesta(self):
+        """La trampa sigue ocupando su casilla (activa o animándose)"""
+        return self.activa or self.animando
 
 
 class TrapManager:
-    def __init__(self, max_trampas=3, cooldown=5.0):
+    def __init__(self, max_trampas=3, cooldown=5.0, ocupacion=None):
         self.trampas = []
         self.max_trampas = max_trampas
         self.cooldown = cooldown
-        self.ultimo_uso = 0
+        # Grilla compartida con el jugador y los enemigos (trampas por casilla)
+        self.ocupacion = ocupacion if ocupacion is not None else OccupancyGrid()
+        # Permitir colocar la primera trampa apenas empieza la partida
+        self.ultimo_uso = -cooldown
         
     def puede_colocar_trampa(self, tiempo_actual):
         return tiempo_actual - self.ultimo_uso >= self.cooldown
@@ -114,12 +99,12 @@ class TrapManager:
             return False
         
         # Verificar que no haya ya una trampa en esa posición
-        for trampa in self.trampas:
-            if (trampa.activa or trampa.animando) and trampa.get_posicion() == (fila, col):
+        for trampa in self.ocupacion.en((fila, col), Trap):
+            if trampa.esta_puesta():
                 return False
         
         # Si hay 3 o más trampas activas/animando, eliminar la más antigua
-        trampas_existentes = [t for t in self.trampas if (t.activa or t.animando)]
+        trampas_existentes = [t for t in self.trampas if t.esta_puesta()]
         if len(trampas_existentes) >= self.max_trampas:
             # Eliminar la primera trampa (la más antigua)
             trampa_antigua = trampas_existentes[0]
@@ -128,10 +113,11 @@ class TrapManager:
         # Colocar trampa
         nueva_trampa = Trap(fila, col, tile_size)
         self.trampas.append(nueva_trampa)
+        self.ocupacion.agregar(nueva_trampa, (fila, col))
         self.ultimo_uso = tiempo_actual
         return True
     
-    def actualizar(self):
+    def actualizar(self, tiempo_actual=None):
         """Actualiza todas las trampas (animaciones) y limpia las que deben desaparecer"""
         # Actualizar cada trampa
         for trampa in self.trampas:
@@ -139,21 +125,30 @@ class TrapManager:
         
         # Eliminar trampas que terminaron su animación
         trampas_antes = len(self.trampas)
+        for trampa in self.trampas:
+            if trampa.debe_desaparecer:
+                self.ocupacion.quitar(trampa, trampa.get_posicion())
         self.trampas = [t for t in self.trampas if not t.debe_desaparecer]
         
         # Si se eliminó alguna trampa, reiniciar cooldown
         if len(self.trampas) < trampas_antes:
-            import pygame
-            self.ultimo_uso = pygame.time.get_ticks() / 1000
+            if tiempo_actual is None:
+                tiempo_actual = pygame.time.get_ticks() / 1000
+            self.ultimo_uso = tiempo_actual
     
-    def verificar_colisiones(self, enemigos, tiempo_actual):
+    def verificar_colisiones(self, tiempo_actual):
+        """Activa las trampas pisadas por un enemigo vivo
+
+        Los enemigos deben estar registrados en la misma grilla de ocupación.
+        """
         enemigos_eliminados = 0
         
         for trampa in self.trampas:
             if not trampa.activa or trampa.animando:
                 continue
             
-            for enemigo in enemigos:
+            # Solo los enemigos que están en la casilla de la trampa
+            for enemigo in self.ocupacion.en(trampa.get_posicion(), Enemy):
                 if enemigo.vivo and trampa.colisiona_con_enemigo(enemigo.get_posicion()):
                     # Activar trampa (animación)
                     trampa.activar()
@@ -166,9 +161,16 @@ class TrapManager:
         
         return enemigos_eliminados
     
-    def dibujar(self, ventana, margen_x, margen_y):
+    def dibujar(self, ventana, margen_x, margen_y, camara=None):
+        """Dibuja las trampas en pantalla y retorna las zonas de la ventana que pintó"""
+        rects = []
         for trampa in self.trampas:
-            trampa.dibujar(ventana, margen_x, margen_y)
+            # Solo las que están en pantalla
+            if camara is None or camara.es_visible(trampa.fila, trampa.col):
+                rect = trampa.dibujar(ventana, margen_x, margen_y)
+                if rect is not None:
+                    rects.append(rect)
+        return rects
     
     def get_cooldown_restante(self, tiempo_actual):
         tiempo_restante = self.cooldown - (tiempo_actual - self.ultimo_uso)